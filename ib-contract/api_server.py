@@ -47,6 +47,8 @@ class ContractAPIServer(BaseAPIServer):
         # Initialize contract index for fast lookups
         from ib_util import get_contract_index, TradingHoursServiceFactory
         self.contract_index = get_contract_index()
+        # Keep the index current from cache file changes (no-op without watchdog)
+        self.contract_index.start_watching(self.cache.cache_dir, self.cache.prefix)
         
         # Initialize trading hours service with SOLID principles
         self.trading_hours_service = TradingHoursServiceFactory.create_service(
@@ -374,6 +376,7 @@ class ContractAPIServer(BaseAPIServer):
     
     async def shutdown(self):
         """Service-specific shutdown logic"""
+        self.contract_index.stop_watching()
         if self.tws_app and self.tws_app.is_connected():
             self.tws_app.disconnect_and_stop()
             self.logger.info("TWS connection closed")
@@ -31,7 +31,7 @@ from .trading_hours_service import (
 from .response_formatting import (
     format_timestamp, format_iso_timestamp, format_json_response, create_api_response,
     create_error_response, create_contract_lookup_response, create_health_check_response,
-    format_cache_status_response, format_sse_event, format_price, format_size, format_percentage
+    format_cache_status_response, format_sse_event, format_sse_event_bytes, format_price, format_size, format_percentage
 )
 from .base_api_server import BaseAPIServer, create_standardized_health_response, create_standardized_error_response
 from .cache_manager import CacheManager, CacheException, CacheFileError, CacheValidationError, CacheFilenameGenerator
@@ -71,6 +71,7 @@ __all__ = [
     'create_health_check_response',
     'format_cache_status_response',
     'format_sse_event',
+    'format_sse_event_bytes',
     'format_price',
     'format_size',
     'format_percentage',
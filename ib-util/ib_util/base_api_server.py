@@ -5,6 +5,7 @@ Provides common FastAPI server functionality including standardized setup,
 logging configuration, health checks, and lifecycle management.
 """
 
+import json
 import logging
 import os
 from abc import ABC, abstractmethod
@@ -13,6 +14,14 @@ from typing import Any, Dict, Optional
 
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, Response
+
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as _JSONResponseClass
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+    _JSONResponseClass = JSONResponse
 
 from .config_loader import load_environment_config
 from .logging_config import configure_service_logging, log_environment_info
@@ -49,6 +58,7 @@ class BaseAPIServer(ABC):
         self.service_name = service_name
         self.service_type = service_type
         self.version = version
+        self._root_payload_bytes: Optional[bytes] = None
         
         # Configure logging
         self.logger = configure_service_logging(service_name, verbose=verbose_logging)
@@ -106,22 +116,33 @@ class BaseAPIServer(ABC):
     def _setup_common_endpoints(self):
         """Setup common endpoints that all services should have"""
         
-        @self.app.get("/")
+        @self.app.get("/", response_class=_JSONResponseClass, include_in_schema=False)
         async def root():
             """Root endpoint with API information"""
-            info = self.get_api_info()
-            return {
-                "message": info.get("title", f"{self.service_name} API"),
-                "version": self.version,
-                "service": self.service_name,
-                **info
-            }
-        
-        @self.app.get("/health")
+            # The payload is constant for the lifetime of the server, so it is
+            # serialized once on first request and served as raw bytes after that
+            if self._root_payload_bytes is None:
+                self._root_payload_bytes = self._build_root_payload()
+            return Response(content=self._root_payload_bytes, media_type="application/json")
+        
+        @self.app.get("/health", response_class=_JSONResponseClass)
         async def health_check():
             """Health check endpoint"""
             return await self.get_health_status()
     
+    def _build_root_payload(self) -> bytes:
+        """Serialize the root endpoint payload"""
+        info = self.get_api_info()
+        payload = {
+            "message": info.get("title", f"{self.service_name} API"),
+            "version": self.version,
+            "service": self.service_name,
+            **info
+        }
+        if orjson is not None:
+            return orjson.dumps(payload)
+        return json.dumps(payload).encode("utf-8")
+    
     @abstractmethod
     def setup_endpoints(self):
         """Setup service-specific endpoints - must be implemented by subclasses"""
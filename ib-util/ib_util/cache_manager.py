@@ -13,6 +13,10 @@ from typing import Any, Dict, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+# Pre-bound filename templates for the per-lookup cache paths
+_SYMBOL_CACHE_FILENAME = "{}-{}.json".format
+_CONTRACT_CACHE_FILENAME = "{}-contract_{}.json".format
+
 
 class CacheException(Exception):
     """Base exception for cache operations"""
@@ -40,14 +44,12 @@ class CacheFilenameGenerator:
     @staticmethod 
     def generate_symbol_cache_filename(prefix: str, cache_key: str) -> str:
         """Generate filename for symbol-based cache"""
-        date_prefix = CacheFilenameGenerator.get_date_prefix()
-        return f"{date_prefix}-{cache_key}.json"
+        return _SYMBOL_CACHE_FILENAME(CacheFilenameGenerator.get_date_prefix(), cache_key)
     
     @staticmethod
     def generate_contract_cache_filename(contract_id: int) -> str:
         """Generate filename for contract ID-based cache"""
-        date_prefix = CacheFilenameGenerator.get_date_prefix()
-        return f"{date_prefix}-contract_{contract_id}.json"
+        return _CONTRACT_CACHE_FILENAME(CacheFilenameGenerator.get_date_prefix(), contract_id)
     
     @staticmethod
     def get_file_patterns(prefix: Optional[str] = None) -> list[str]:
@@ -31,6 +31,7 @@ from .loader import (
 from .compat import (
     ConfigMigrator,
     create_compatible_config,
+    invalidate_config_cache,
     migrate_legacy_config_object,
     validate_migration
 )
@@ -58,6 +59,7 @@ __all__ = [
     # Compatibility layer
     'ConfigMigrator',
     'create_compatible_config',
+    'invalidate_config_cache',
     'migrate_legacy_config_object',
     'validate_migration',
 ]
\ No newline at end of file
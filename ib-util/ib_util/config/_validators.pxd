@@ -0,0 +1,5 @@
+# Cython declarations for _validators.py, applied only when the module is
+# compiled (see setup.py). The range checks run on C integers.
+
+cpdef bint valid_port(long long port)
+cpdef bint valid_client_id(long long client_id)
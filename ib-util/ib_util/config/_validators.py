@@ -0,0 +1,114 @@
+"""
+Field validation helpers for the configuration models.
+
+Kept free of Pydantic classes so the module can be compiled with Cython
+(see ``setup.py``); the pure-Python source is used when no compiled
+extension is available. ``_validators.pxd`` gives the compiled build C types
+for the range checks.
+"""
+
+from pathlib import Path
+
+VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+# Paths already seen to exist. Only positive results are remembered so a
+# directory created later in the process is still picked up.
+_existing_paths = set()
+
+
+def _path_exists(path):
+    """Return True if ``path`` exists, caching positive results per process."""
+    if path in _existing_paths:
+        return True
+    if path.exists():
+        _existing_paths.add(path)
+        return True
+    return False
+
+
+def clear_path_cache():
+    """Forget cached path existence results, e.g. after removing directories."""
+    _existing_paths.clear()
+
+
+def valid_port(port):
+    """Return True if ``port`` is in the TCP port range."""
+    return 1 <= port <= 65535
+
+
+def valid_client_id(client_id):
+    """Return True if ``client_id`` is in the IB API client ID range."""
+    return 1 <= client_id <= 32767
+
+
+def _in_range(check, value):
+    # Compiled range checks take C integers; out-of-range Python ints
+    # overflow on conversion and are simply invalid.
+    try:
+        return check(value)
+    except OverflowError:
+        return False
+
+
+def parse_ports(v):
+    """Parse ports from a comma-separated string, single integer or list."""
+    if isinstance(v, str):
+        # Handle comma-separated string like "4002,4001"
+        return [int(port.strip()) for port in v.split(',')]
+    elif isinstance(v, int):
+        # Handle single integer
+        return [v]
+    elif isinstance(v, list):
+        # Handle list (ensure all are integers)
+        return [int(port) for port in v]
+    return v
+
+
+def check_ports(v):
+    """Ensure all ports are valid."""
+    # min()/max() scan the list in C; the offending port is only searched
+    # for once the bulk check has failed
+    if v and not (_in_range(valid_port, min(v)) and _in_range(valid_port, max(v))):
+        port = next(p for p in v if not _in_range(valid_port, p))
+        raise ValueError(f"Invalid port: {port}")
+    return v
+
+
+def check_port(v):
+    """Ensure port is valid."""
+    if not _in_range(valid_port, v):
+        raise ValueError(f"Invalid port: {v}")
+    return v
+
+
+def check_client_id(v):
+    """Ensure client ID is in valid range."""
+    if not _in_range(valid_client_id, v):
+        raise ValueError(f"Client ID must be between 1 and 32767, got: {v}")
+    return v
+
+
+def normalize_log_level(v):
+    """Ensure log level is valid and return it upper-cased."""
+    level = v.upper()
+    if level not in VALID_LOG_LEVELS:
+        raise ValueError(f"Invalid log level: {v}. Must be one of {set(VALID_LOG_LEVELS)}")
+    return level
+
+
+def check_storage_path(v):
+    """Ensure storage path is valid."""
+    path = Path(v)
+    if path.is_absolute():
+        # For absolute paths, check if parent exists
+        if not _path_exists(path.parent):
+            raise ValueError(f"Parent directory does not exist: {path.parent}")
+    return str(path)
+
+
+def check_project_root(v):
+    """Ensure project root exists and return it as an absolute path."""
+    path = Path(v)
+    if not _path_exists(path):
+        raise ValueError(f"Project root does not exist: {path}")
+    return str(path.absolute())
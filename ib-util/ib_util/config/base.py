@@ -6,13 +6,18 @@ across ib-stream, ib-contract, ib-studies, and other projects.
 """
 
 import os
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from functools import cached_property, lru_cache
+from typing import List, Optional, Dict, Any, Iterator
 from pathlib import Path
 
 from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from . import _validators
+
 
 class IBEnvironment(str, Enum):
     """Supported deployment environments."""
@@ -22,6 +27,44 @@ class IBEnvironment(str, Enum):
     TESTING = "testing"
 
 
+# Prefix-filtered environment snapshots shared by everything built inside
+# shared_env_snapshot(), keyed by env prefix
+_ENV_SNAPSHOT: ContextVar[Optional[Dict[str, frozenset]]] = ContextVar('_ENV_SNAPSHOT', default=None)
+
+
+@contextmanager
+def shared_env_snapshot():
+    """
+    Filter ``os.environ`` at most once per env prefix within this block.
+    
+    The storage and server sub-configs share the ``IB_STREAM_`` prefix, so a
+    top-level config load would otherwise scan the environment for it twice.
+    Nested use reuses the outer snapshot.
+    """
+    if _ENV_SNAPSHOT.get() is not None:
+        yield
+        return
+    token = _ENV_SNAPSHOT.set({})
+    try:
+        yield
+    finally:
+        _ENV_SNAPSHOT.reset(token)
+
+
+def _prefixed_env(prefix: str) -> frozenset:
+    """Return the environment variables starting with ``prefix`` as a hashable key."""
+    snapshot = _ENV_SNAPSHOT.get()
+    if snapshot is not None and prefix in snapshot:
+        return snapshot[prefix]
+    env_key = frozenset(
+        (key, value) for key, value in os.environ.items()
+        if key.upper().startswith(prefix)
+    )
+    if snapshot is not None:
+        snapshot[prefix] = env_key
+    return env_key
+
+
 class IBConnectionConfig(BaseSettings):
     """Interactive Brokers connection configuration."""
     
@@ -34,40 +77,27 @@ class IBConnectionConfig(BaseSettings):
     model_config = SettingsConfigDict(
         env_prefix="IB_",
         # Disable JSON parsing for lists to allow custom parsing
-        env_parse_none_str="null"
+        env_parse_none_str="null",
+        frozen=True
     )
         
     @field_validator('ports', mode='before')
     @classmethod
     def parse_ports(cls, v):
         """Parse ports from string or list."""
-        if isinstance(v, str):
-            # Handle comma-separated string like "4002,4001"
-            return [int(port.strip()) for port in v.split(',')]
-        elif isinstance(v, int):
-            # Handle single integer
-            return [v]
-        elif isinstance(v, list):
-            # Handle list (ensure all are integers)
-            return [int(port) for port in v]
-        return v
+        return _validators.parse_ports(v)
     
     @field_validator('ports')
     @classmethod
     def validate_ports(cls, v):
         """Ensure all ports are valid."""
-        for port in v:
-            if not (1 <= port <= 65535):
-                raise ValueError(f"Invalid port: {port}")
-        return v
+        return _validators.check_ports(v)
     
     @field_validator('client_id')
     @classmethod
     def validate_client_id(cls, v):
         """Ensure client ID is in valid range."""
-        if not (1 <= v <= 32767):
-            raise ValueError(f"Client ID must be between 1 and 32767, got: {v}")
-        return v
+        return _validators.check_client_id(v)
 
 
 class IBStorageConfig(BaseSettings):
@@ -90,18 +120,13 @@ class IBStorageConfig(BaseSettings):
     buffer_size: int = Field(default=100, description="Storage buffer size")
     max_file_size_mb: int = Field(default=100, description="Maximum file size in MB")
     
-    model_config = SettingsConfigDict(env_prefix="IB_STREAM_")
+    model_config = SettingsConfigDict(env_prefix="IB_STREAM_", frozen=True)
         
     @field_validator('storage_path')
     @classmethod
     def validate_storage_path(cls, v):
         """Ensure storage path is valid."""
-        path = Path(v)
-        if path.is_absolute():
-            # For absolute paths, check if parent exists
-            if not path.parent.exists():
-                raise ValueError(f"Parent directory does not exist: {path.parent}")
-        return str(path)
+        return _validators.check_storage_path(v)
 
 
 class IBServerConfig(BaseSettings):
@@ -113,24 +138,38 @@ class IBServerConfig(BaseSettings):
     max_streams: int = Field(default=50, description="Maximum concurrent streams")
     enable_cors: bool = Field(default=True, description="Enable CORS")
     
-    model_config = SettingsConfigDict(env_prefix="IB_STREAM_")
+    model_config = SettingsConfigDict(env_prefix="IB_STREAM_", frozen=True)
         
     @field_validator('port')
     @classmethod
     def validate_port(cls, v):
         """Ensure port is valid."""
-        if not (1 <= v <= 65535):
-            raise ValueError(f"Invalid port: {v}")
-        return v
+        return _validators.check_port(v)
     
     @field_validator('log_level')
     @classmethod
     def validate_log_level(cls, v):
         """Ensure log level is valid."""
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        if v.upper() not in valid_levels:
-            raise ValueError(f"Invalid log level: {v}. Must be one of {valid_levels}")
-        return v.upper()
+        return _validators.normalize_log_level(v)
+
+
+@lru_cache(maxsize=32)
+def _cached_default(settings_cls: type, env_key: frozenset) -> BaseSettings:
+    return settings_cls()
+
+
+def _shared_default(settings_cls: type) -> BaseSettings:
+    """
+    Return a shared default instance of a frozen sub-configuration.
+    
+    Instances are keyed on the environment variables matching the class's
+    env prefix, so defaults still follow env files loaded after import.
+    """
+    return _cached_default(settings_cls, _prefixed_env(settings_cls.model_config["env_prefix"]))
+
+
+# cached_property values on IBBaseConfig that are derived from its fields
+_DERIVED_ATTRS = ('config_dir', 'storage_path', 'env_dict')
 
 
 class IBBaseConfig(BaseSettings):
@@ -142,33 +181,51 @@ class IBBaseConfig(BaseSettings):
     project_root: str = Field(default=".", description="Project root directory")
     
     # Component configurations
-    connection: IBConnectionConfig = Field(default_factory=IBConnectionConfig)
-    storage: IBStorageConfig = Field(default_factory=IBStorageConfig)
-    server: IBServerConfig = Field(default_factory=IBServerConfig)
+    connection: IBConnectionConfig = Field(default_factory=lambda: _shared_default(IBConnectionConfig))
+    storage: IBStorageConfig = Field(default_factory=lambda: _shared_default(IBStorageConfig))
+    server: IBServerConfig = Field(default_factory=lambda: _shared_default(IBServerConfig))
     
     # Instance identification (for multi-instance deployments)
     instance_id: Optional[str] = Field(default=None, description="Unique instance identifier")
     
-    model_config = SettingsConfigDict(arbitrary_types_allowed=True)
+    # Configs are immutable once loaded, which also keeps the cached
+    # env_dict below consistent with the field values
+    model_config = SettingsConfigDict(arbitrary_types_allowed=True, frozen=True)
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> 'IBBaseConfig':
+        """Copy the config, dropping cached derived values if fields change."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in _DERIVED_ATTRS:
+                copied.__dict__.pop(name, None)
+        return copied
     
     @field_validator('project_root')
     @classmethod
     def validate_project_root(cls, v):
         """Ensure project root exists."""
-        path = Path(v)
-        if not path.exists():
-            raise ValueError(f"Project root does not exist: {path}")
-        return str(path.absolute())
+        return _validators.check_project_root(v)
     
     def get_config_dir(self) -> Path:
         """Get the configuration directory for this service."""
-        return Path(self.project_root) / "config"
+        return self.config_dir
     
     def get_storage_path(self) -> Path:
         """Get the full storage path."""
-        if Path(self.storage.storage_path).is_absolute():
-            return Path(self.storage.storage_path)
-        return Path(self.project_root) / self.storage.storage_path
+        return self.storage_path
+    
+    @cached_property
+    def config_dir(self) -> Path:
+        """Configuration directory, resolved once per (frozen) config."""
+        return Path(self.project_root) / "config"
+    
+    @cached_property
+    def storage_path(self) -> Path:
+        """Full storage path, resolved once per (frozen) config."""
+        storage_path = Path(self.storage.storage_path)
+        if storage_path.is_absolute():
+            return storage_path
+        return Path(self.project_root) / storage_path
     
     def get_instance_suffix(self) -> str:
         """Get suffix for instance-specific resources."""
@@ -178,6 +235,20 @@ class IBBaseConfig(BaseSettings):
     
     def to_env_dict(self) -> Dict[str, str]:
         """Convert configuration to environment variables dictionary."""
+        return self.env_dict.copy()
+    
+    def to_env_lines(self) -> Iterator[str]:
+        """Yield ``KEY=value`` lines (newline-terminated) for writing an env file."""
+        for key, value in self.env_dict.items():
+            yield f"{key}={value}\n"
+    
+    @cached_property
+    def env_dict(self) -> Dict[str, str]:
+        """Environment variables for this configuration, computed once.
+        
+        Treat the returned dictionary as read-only; use ``to_env_dict()``
+        for a copy that can be modified.
+        """
         env_dict = {}
         
         # Service-level variables
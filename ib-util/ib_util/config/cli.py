@@ -9,19 +9,17 @@ This module is kept for reference but is not used in production.
 """
 
 import sys
-import json
-from pathlib import Path
 from typing import Optional
 
 import click
-from .base import IBEnvironment
-from .loader import (
-    load_config, 
-    load_orchestration_for_environment,
-    validate_configuration,
-    ConfigLoader
-)
-from .orchestration import IBOrchestrationConfig
+
+# Command dependencies (json, pathlib, the config loader and its Pydantic
+# models) are imported inside each command so that importing this module or
+# running --help does not pay for them.
+
+# Shared by every --environment option; mirrors the IBEnvironment values
+# without importing the Pydantic models at module load
+_ENVIRONMENT_CHOICE = click.Choice(['development', 'production', 'staging', 'testing'])
 
 
 @click.group()
@@ -32,22 +30,31 @@ def config_cli():
 
 @config_cli.command()
 @click.option('--service', required=True, help='Service name (e.g., ib-stream, ib-contract)')
-@click.option('--environment', type=click.Choice(['development', 'production', 'staging', 'testing']), 
+@click.option('--environment', type=_ENVIRONMENT_CHOICE, 
               default='development', help='Target environment')
 @click.option('--format', 'output_format', type=click.Choice(['json', 'yaml', 'env']), 
               default='json', help='Output format')
 def show(service: str, environment: str, output_format: str):
     """Show configuration for a service."""
+    from .base import IBEnvironment
+    from .loader import load_config
+    
     try:
         env = IBEnvironment(environment)
         config = load_config(service, environment=env)
         
         if output_format == 'json':
-            click.echo(json.dumps(config.dict(), indent=2, default=str))
+            # mode='json' converts enums and other non-JSON types in the same
+            # pass, so no default= fallback is needed in the encoder
+            data = config.model_dump(mode='json')
+            try:
+                import orjson
+                click.echo(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+            except ImportError:
+                import json
+                click.echo(json.dumps(data, indent=2))
         elif output_format == 'env':
-            env_dict = config.to_env_dict()
-            for key, value in env_dict.items():
-                click.echo(f"{key}={value}")
+            click.echo("".join(config.to_env_lines()), nl=False)
         else:
             click.echo("YAML output not yet implemented")
             
@@ -57,11 +64,15 @@ def show(service: str, environment: str, output_format: str):
 
 
 @config_cli.command()
-@click.option('--environment', type=click.Choice(['development', 'production', 'staging', 'testing']), 
+@click.option('--environment', type=_ENVIRONMENT_CHOICE, 
               default='development', help='Target environment')
 @click.option('--output', help='Output file for supervisor configuration')
 def orchestration(environment: str, output: Optional[str]):
     """Generate orchestration configuration."""
+    from pathlib import Path
+    from .base import IBEnvironment
+    from .loader import load_orchestration_for_environment
+    
     try:
         env = IBEnvironment(environment)
         config = load_orchestration_for_environment(env)
@@ -82,6 +93,8 @@ def orchestration(environment: str, output: Optional[str]):
 @config_cli.command()
 def validate():
     """Validate configuration setup."""
+    from .loader import validate_configuration
+    
     results = validate_configuration()
     
     if results['valid']:
@@ -116,11 +129,15 @@ def validate():
 
 
 @config_cli.command()
-@click.option('--environment', type=click.Choice(['development', 'production', 'staging', 'testing']), 
+@click.option('--environment', type=_ENVIRONMENT_CHOICE, 
               required=True, help='Target environment')
 @click.option('--output-dir', default='config', help='Output directory for new configuration files')
 def migrate(environment: str, output_dir: str):
     """Migrate legacy configuration to new format."""
+    from pathlib import Path
+    from .base import IBEnvironment
+    from .loader import ConfigLoader
+    
     try:
         env = IBEnvironment(environment)
         project_root = Path.cwd()
@@ -137,33 +154,37 @@ def migrate(environment: str, output_dir: str):
             project_root / "ib-stream" / "config" / "production-server.env",
         ]
         
-        found_files = [f for f in legacy_files if f.exists()]
+        # Single pass: one stat per file, collecting paths and names together
+        found_paths = []
+        found_names = []
+        for legacy_file in legacy_files:
+            if legacy_file.exists():
+                found_paths.append(str(legacy_file))
+                found_names.append(legacy_file.name)
         
-        if not found_files:
+        if not found_paths:
             click.echo("No legacy configuration files found to migrate")
             return
         
-        click.echo(f"Found {len(found_files)} legacy files to migrate:")
-        for f in found_files:
-            click.echo(f"  • {f}")
+        click.echo(f"Found {len(found_paths)} legacy files to migrate:")
+        click.echo("\n".join(f"  • {path}" for path in found_paths))
         
-        # Load and convert each legacy file
-        for legacy_file in found_files:
-            loader.load_legacy_env_file(str(legacy_file))
+        # Load and convert all legacy files in one pass
+        loader.load_legacy_env_files(found_paths)
         
         # Create new configuration files
         base_config = loader.create_service_config("base", env)
         
         # Write new .env file
         new_env_file = output_path / f".env.{environment}"
-        env_dict = base_config.to_env_dict()
+        header = (
+            f"# Migrated configuration for {environment} environment\n"
+            f"# Generated from legacy files: {found_names}\n\n"
+        )
         
         with open(new_env_file, 'w') as f:
-            f.write(f"# Migrated configuration for {environment} environment\n")
-            f.write(f"# Generated from legacy files: {[f.name for f in found_files]}\n\n")
-            
-            for key, value in env_dict.items():
-                f.write(f"{key}={value}\n")
+            f.write(header)
+            f.writelines(base_config.to_env_lines())
         
         click.echo(f"✓ Migrated configuration written to {new_env_file}")
         
@@ -187,11 +208,14 @@ def migrate(environment: str, output_dir: str):
 
 
 @config_cli.command()
-@click.option('--environment', type=click.Choice(['development', 'production', 'staging', 'testing']), 
+@click.option('--environment', type=_ENVIRONMENT_CHOICE, 
               default='development', help='Target environment')
 @click.option('--service', help='Specific service to start (default: all enabled services)')
 def start(environment: str, service: Optional[str]):
     """Start services using orchestration configuration."""
+    from .base import IBEnvironment
+    from .loader import load_orchestration_for_environment
+    
     try:
         env = IBEnvironment(environment)
         config = load_orchestration_for_environment(env)
@@ -7,14 +7,68 @@ while allowing services to gradually adopt the new type-safe configuration.
 
 import os
 import logging
+from functools import lru_cache
 from typing import Any, Dict, Optional, List
 from pathlib import Path
 
 from .base import IBBaseConfig, IBEnvironment
-from .loader import load_config
+from .loader import _detect_project_root, _get_loader, load_config
 
 logger = logging.getLogger(__name__)
 
+# Environment variables that can influence the resolved configuration
+_CONFIG_ENV_PREFIXES = ('IB_', 'PROJECT_ROOT', 'HOST', 'PORT')
+
+# Every variable read by ConfigMigrator._create_legacy_config
+_LEGACY_ENV_KEYS = (
+    'IB_ENVIRONMENT', 'PROJECT_ROOT',
+    'IB_HOST', 'IB_STREAM_HOST', 'IB_CONTRACTS_HOST',
+    'IB_PORTS', 'IB_STREAM_PORTS',
+    'IB_CLIENT_ID', 'IB_STREAM_CLIENT_ID', 'IB_CONTRACTS_CLIENT_ID',
+    'HOST', 'IB_STREAM_BIND_HOST',
+    'PORT', 'IB_STREAM_PORT', 'IB_CONTRACTS_PORT',
+    'IB_STREAM_LOG_LEVEL', 'IB_STREAM_MAX_STREAMS',
+    'IB_STREAM_ENABLE_STORAGE', 'IB_STREAM_STORAGE_PATH',
+    'IB_STREAM_ENABLE_JSON', 'IB_STREAM_ENABLE_PROTOBUF',
+    'IB_STREAM_ENABLE_POSTGRES', 'IB_STREAM_ENABLE_BACKGROUND_STREAMING',
+    'IB_STREAM_TRACKED_CONTRACTS', 'IB_STREAM_BUFFER_SIZE',
+)
+
+# Instance env files probed by the legacy fallback, in priority order
+_LEGACY_INSTANCE_FILES = (
+    "ib-stream/config/instance.env",
+    "../ib-stream/config/instance.env",
+    "../config/instance.env",
+    "config/instance.env",
+)
+
+# create_compatible_config results by (service, cwd, config env snapshot)
+_COMPATIBLE_CONFIG_CACHE: Dict[tuple, IBBaseConfig] = {}
+_COMPATIBLE_CONFIG_CACHE_SIZE = 32
+
+
+def _first(env: Dict[str, str], keys: tuple, default: str) -> str:
+    """Return the value of the first key present in env, or default."""
+    for key in keys:
+        value = env.get(key)
+        if value is not None:
+            return value
+    return default
+
+
+@lru_cache(maxsize=16)
+def _apply_env_file(path: str, mtime_ns: int) -> None:
+    """
+    Load a legacy env file into os.environ once per file version.
+    
+    Loading never overrides existing variables, so re-applying an unchanged
+    file is a no-op; the cache key includes the mtime to pick up edits.
+    """
+    from ib_util.config_loader import load_environment_file_with_detection
+    
+    load_environment_file_with_detection(path)
+    logger.debug(f"Loaded instance config: {path}")
+
 
 class ConfigMigrator:
     """
@@ -23,6 +77,25 @@ class ConfigMigrator:
     Provides fallback mechanisms and compatibility helpers for existing services.
     """
     
+    __slots__ = (
+        'service_name', 'legacy_config_path', '_new_config',
+        '_legacy_fallback_used', '_legacy_env',
+    )
+    
+    # Legacy environment variables per setting, in priority order
+    _DEFAULT_LEGACY_KEYS = {
+        'host': ('IB_STREAM_HOST', 'IB_HOST'),
+        'client_id': ('IB_STREAM_CLIENT_ID', 'IB_CLIENT_ID'),
+        'port': ('IB_STREAM_PORT', 'PORT'),
+    }
+    _LEGACY_KEYS = {
+        'ib-contract': {
+            'host': ('IB_CONTRACTS_HOST', 'IB_STREAM_HOST', 'IB_HOST'),
+            'client_id': ('IB_CONTRACTS_CLIENT_ID', 'IB_STREAM_CLIENT_ID', 'IB_CLIENT_ID'),
+            'port': ('IB_CONTRACTS_PORT', 'IB_STREAM_PORT', 'PORT'),
+        },
+    }
+    
     def __init__(self, service_name: str, legacy_config_path: Optional[str] = None):
         """
         Initialize configuration migrator.
@@ -35,6 +108,7 @@ class ConfigMigrator:
         self.legacy_config_path = legacy_config_path
         self._new_config: Optional[IBBaseConfig] = None
         self._legacy_fallback_used = False
+        self._legacy_env: Optional[Dict[str, str]] = None
     
     def get_config(self) -> IBBaseConfig:
         """
@@ -61,41 +135,30 @@ class ConfigMigrator:
         # Load environment files first (like the legacy system does)
         self._load_legacy_env_files()
         
-        # Extract legacy environment variables
+        # Extract legacy environment variables; every setting below reads
+        # from this one snapshot
         legacy_env = self._extract_legacy_env()
         
         # Map to new configuration format
         config_data = {
             'service_name': self.service_name,
-            'environment': IBEnvironment(os.getenv('IB_ENVIRONMENT', 'development')),
-            'project_root': os.getenv('PROJECT_ROOT', os.getcwd()),
+            'environment': IBEnvironment(legacy_env.get('IB_ENVIRONMENT', 'development')),
+            'project_root': legacy_env.get('PROJECT_ROOT') or os.getcwd(),
         }
         
-        # Map connection settings (always create, use defaults if not found)
-        # Handle service-specific environment variables
-        if self.service_name == 'ib-contract':
-            client_id_key = 'IB_CONTRACTS_CLIENT_ID'
-            host_key = 'IB_CONTRACTS_HOST'
-        else:
-            client_id_key = 'IB_STREAM_CLIENT_ID'
-            host_key = 'IB_STREAM_HOST'
+        # Map connection and server settings (always create, use defaults if not found)
+        # Service-specific variables take priority over the shared IB_STREAM_* ones
+        keys = self._LEGACY_KEYS.get(self.service_name, self._DEFAULT_LEGACY_KEYS)
         
         config_data['connection'] = {
-            'host': legacy_env.get(host_key, legacy_env.get('IB_STREAM_HOST', legacy_env.get('IB_HOST', 'localhost'))),
-            'ports': self._parse_ports(legacy_env.get('IB_STREAM_PORTS', legacy_env.get('IB_PORTS', '4002'))),
-            'client_id': int(legacy_env.get(client_id_key, legacy_env.get('IB_STREAM_CLIENT_ID', legacy_env.get('IB_CLIENT_ID', '100')))),
+            'host': _first(legacy_env, keys['host'], 'localhost'),
+            'ports': self._parse_ports(_first(legacy_env, ('IB_STREAM_PORTS', 'IB_PORTS'), '4002')),
+            'client_id': int(_first(legacy_env, keys['client_id'], '100')),
         }
         
-        # Map server settings (always create, use defaults if not found)
-        # Handle service-specific port variables
-        if self.service_name == 'ib-contract':
-            port_key = 'IB_CONTRACTS_PORT'
-        else:
-            port_key = 'IB_STREAM_PORT'
-        
         config_data['server'] = {
-            'host': legacy_env.get('IB_STREAM_BIND_HOST', legacy_env.get('HOST', '0.0.0.0')),
-            'port': int(legacy_env.get(port_key, legacy_env.get('IB_STREAM_PORT', legacy_env.get('PORT', '8001')))),
+            'host': _first(legacy_env, ('IB_STREAM_BIND_HOST', 'HOST'), '0.0.0.0'),
+            'port': int(_first(legacy_env, keys['port'], '8001')),
             'log_level': legacy_env.get('IB_STREAM_LOG_LEVEL', 'INFO'),
             'max_streams': int(legacy_env.get('IB_STREAM_MAX_STREAMS', '50')),
         }
@@ -131,21 +194,15 @@ class ConfigMigrator:
         try:
             # Use the same logic as the legacy config system
             from ib_util.config_loader import load_environment_file_with_detection
-            from pathlib import Path
             
             # Load instance configuration first
-            instance_files = [
-                "ib-stream/config/instance.env",
-                "../ib-stream/config/instance.env", 
-                "../config/instance.env",
-                "config/instance.env"
-            ]
-            
-            for path in instance_files:
-                if Path(path).exists():
-                    load_environment_file_with_detection(path)
-                    logger.debug(f"Loaded instance config: {path}")
-                    break
+            for path in _LEGACY_INSTANCE_FILES:
+                try:
+                    mtime_ns = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+                _apply_env_file(path, mtime_ns)
+                break
             
             # Load environment-specific configuration
             load_environment_file_with_detection()
@@ -154,23 +211,29 @@ class ConfigMigrator:
             logger.warning(f"Failed to load legacy environment files: {e}")
     
     def _extract_legacy_env(self) -> Dict[str, str]:
-        """Extract legacy environment variables."""
-        legacy_prefixes = ['IB_STREAM_', 'IB_', 'PROJECT_ROOT', 'HOST', 'PORT']
-        legacy_env = {}
-        
-        for key, value in os.environ.items():
-            if any(key.startswith(prefix) for prefix in legacy_prefixes):
-                legacy_env[key] = value
+        """
+        Extract legacy environment variables.
         
-        return legacy_env
+        The filtered snapshot is taken once per migrator; call
+        ``invalidate_legacy_env()`` to pick up later environment changes.
+        """
+        if self._legacy_env is None:
+            self._legacy_env = {
+                key: value for key in _LEGACY_ENV_KEYS
+                if (value := os.environ.get(key)) is not None
+            }
+        return self._legacy_env
+    
+    def invalidate_legacy_env(self) -> None:
+        """Drop the cached legacy environment snapshot."""
+        self._legacy_env = None
     
     def _parse_ports(self, ports_str: str) -> List[int]:
         """Parse ports from string format."""
         try:
-            if ',' in ports_str:
-                return [int(p.strip()) for p in ports_str.split(',')]
-            else:
-                return [int(ports_str)]
+            # int() ignores surrounding whitespace, so one split covers
+            # both single and comma-separated values
+            return [int(p) for p in ports_str.split(',')]
         except (ValueError, AttributeError):
             logger.warning(f"Invalid ports format: {ports_str}, using default")
             return [4002]
@@ -210,11 +273,31 @@ class ConfigMigrator:
         return recommendations
 
 
+def _config_env_snapshot() -> frozenset:
+    """Snapshot the configuration-relevant environment as a hashable key."""
+    return frozenset(
+        (key, value) for key, value in os.environ.items()
+        if key.startswith(_CONFIG_ENV_PREFIXES)
+    )
+
+
+def _apply_config_env_files(cwd: str) -> None:
+    """Apply the env files load_config reads from cwd to os.environ."""
+    try:
+        environment = IBEnvironment(os.getenv("IB_ENVIRONMENT", "development"))
+    except ValueError:
+        environment = IBEnvironment.DEVELOPMENT
+    _get_loader(_detect_project_root(cwd)).apply_env_files(environment)
+
+
 def create_compatible_config(service_name: str) -> IBBaseConfig:
     """
     Create configuration with automatic legacy fallback.
     
     This is the main entry point for services migrating to the new system.
+    Env files are applied to the environment first, so results can be cached
+    per service, working directory and configuration environment; call
+    ``invalidate_config_cache()`` to force a reload.
     
     Args:
         service_name: Name of the service
@@ -222,6 +305,13 @@ def create_compatible_config(service_name: str) -> IBBaseConfig:
     Returns:
         Configuration object
     """
+    cwd = os.getcwd()
+    _apply_config_env_files(cwd)
+    key = (service_name, cwd, _config_env_snapshot())
+    config = _COMPATIBLE_CONFIG_CACHE.get(key)
+    if config is not None:
+        return config
+    
     migrator = ConfigMigrator(service_name)
     config = migrator.get_config()
     
@@ -234,9 +324,17 @@ def create_compatible_config(service_name: str) -> IBBaseConfig:
     else:
         logger.info(f"Service {service_name} successfully using new configuration system")
     
+    if len(_COMPATIBLE_CONFIG_CACHE) >= _COMPATIBLE_CONFIG_CACHE_SIZE:
+        _COMPATIBLE_CONFIG_CACHE.clear()
+    _COMPATIBLE_CONFIG_CACHE[key] = config
     return config
 
 
+def invalidate_config_cache() -> None:
+    """Drop cached ``create_compatible_config`` results so the next call reloads."""
+    _COMPATIBLE_CONFIG_CACHE.clear()
+
+
 def migrate_legacy_config_object(legacy_config: Any) -> IBBaseConfig:
     """
     Migrate an existing legacy configuration object to new format.
@@ -320,4 +418,4 @@ def validate_migration() -> Dict[str, Any]:
                 'error': str(e)
             })
     
-    return results
\ No newline at end of file
+    return results
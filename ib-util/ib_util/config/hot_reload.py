@@ -8,43 +8,93 @@ import os
 import logging
 import threading
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Set, Callable, Optional
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from typing import Dict, FrozenSet, Set, Tuple, Callable, Optional
 
-from .loader import ConfigLoader
+from .loader import ConfigLoader, clear_env_file_cache
 from .base import IBBaseConfig
+from .compat import invalidate_config_cache
 
 logger = logging.getLogger(__name__)
 
+# Service named by a config file, e.g. "ib-stream.env" or "contract-dev.env".
+# Tokens are checked in this order, so "contract-stream.env" is a stream file.
+_SERVICES_BY_TOKEN = {
+    'stream': frozenset(('ib-stream',)),
+    'contract': frozenset(('ib-contract',)),
+    'studies': frozenset(('ib-studies',)),
+}
+_ALL_SERVICES = frozenset(('ib-stream', 'ib-contract', 'ib-studies'))
 
-class ConfigFileHandler(FileSystemEventHandler):
-    """Handle configuration file change events."""
+
+class _ConfigFileEvents:
+    """
+    Configuration file event handling.
+    
+    Combined with watchdog's PatternMatchingEventHandler into
+    ``ConfigFileHandler`` on first use, so watchdog is only imported when
+    hot-reload is actually started.
+    """
     
     def __init__(self, reload_callback: Callable[[str], None]):
+        # Let watchdog drop directory and non-.env events before dispatch
+        super().__init__(patterns=['*.env'], ignore_directories=True)
         self.reload_callback = reload_callback
-        self.last_reload = {}
         self.debounce_seconds = 1.0
+        self._pending_paths: Set[str] = set()
+        self._pending_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
     
     def on_modified(self, event):
-        if event.is_directory:
-            return
-        
         file_path = event.src_path
-        if not file_path.endswith('.env'):
-            return
-        
-        # Debounce rapid file changes
-        now = time.time()
-        if file_path in self.last_reload:
-            if now - self.last_reload[file_path] < self.debounce_seconds:
-                return
         
-        self.last_reload[file_path] = now
+        # Coalesce bursts of changes into one reload after the last event
+        with self._lock:
+            self._pending_paths.add(file_path)
+            if self._pending_timer is not None:
+                self._pending_timer.cancel()
+            self._pending_timer = threading.Timer(self.debounce_seconds, self._flush)
+            self._pending_timer.daemon = True
+            self._pending_timer.start()
+    
+    def _flush(self):
+        """Reload once for each file changed since the last flush."""
+        with self._lock:
+            paths, self._pending_paths = self._pending_paths, set()
+            self._pending_timer = None
         
-        logger.info(f"Configuration file changed: {file_path}")
-        self.reload_callback(file_path)
+        log_changes = logger.isEnabledFor(logging.INFO)
+        for file_path in paths:
+            if log_changes:
+                logger.info("Configuration file changed: %s", file_path)
+            self.reload_callback(file_path)
+    
+    def cancel(self):
+        """Drop any pending reload."""
+        with self._lock:
+            if self._pending_timer is not None:
+                self._pending_timer.cancel()
+                self._pending_timer = None
+            self._pending_paths.clear()
+
+
+@lru_cache(maxsize=None)
+def _config_file_handler_class() -> type:
+    from watchdog.events import PatternMatchingEventHandler
+    
+    class ConfigFileHandler(_ConfigFileEvents, PatternMatchingEventHandler):
+        """Handle configuration file change events."""
+    
+    ConfigFileHandler.__module__ = __name__
+    ConfigFileHandler.__qualname__ = "ConfigFileHandler"
+    return ConfigFileHandler
+
+
+def __getattr__(name: str):
+    if name == 'ConfigFileHandler':
+        return _config_file_handler_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ConfigHotReloader:
@@ -55,88 +105,122 @@ class ConfigHotReloader:
     when files are modified.
     """
     
+    __slots__ = (
+        'project_root', 'config_loader', 'observer', 'handler',
+        'callbacks', 'current_configs', 'lock', '_env_files', '_load_cache',
+    )
+    
     def __init__(self, project_root: str):
         self.project_root = Path(project_root)
         self.config_loader = ConfigLoader(str(self.project_root))
         self.observer = None
-        self.callbacks: Dict[str, Set[Callable[[IBBaseConfig], None]]] = {}
+        self.handler: Optional[_ConfigFileEvents] = None
+        # Tuples are rebuilt on (rare) registration so dispatch can iterate a snapshot
+        self.callbacks: Dict[str, Tuple[Callable[[IBBaseConfig], None], ...]] = {}
         self.current_configs: Dict[str, IBBaseConfig] = {}
         self.lock = threading.Lock()
+        # Files create_service_config reads; a service whose files are all
+        # unchanged since its last load reuses that config
+        self._env_files = tuple(map(str, self.config_loader.env_file_paths()))
+        self._load_cache: Dict[str, Tuple[Tuple[Optional[int], ...], IBBaseConfig]] = {}
     
     def register_callback(self, service_name: str, callback: Callable[[IBBaseConfig], None]):
         """Register a callback to be called when configuration changes."""
         with self.lock:
-            if service_name not in self.callbacks:
-                self.callbacks[service_name] = set()
-            self.callbacks[service_name].add(callback)
+            callbacks = self.callbacks.get(service_name, ())
+            if callback not in callbacks:
+                self.callbacks[service_name] = callbacks + (callback,)
     
     def unregister_callback(self, service_name: str, callback: Callable[[IBBaseConfig], None]):
         """Unregister a configuration change callback."""
         with self.lock:
-            if service_name in self.callbacks:
-                self.callbacks[service_name].discard(callback)
-                if not self.callbacks[service_name]:
-                    del self.callbacks[service_name]
+            callbacks = tuple(cb for cb in self.callbacks.get(service_name, ()) if cb != callback)
+            if callbacks:
+                self.callbacks[service_name] = callbacks
+            else:
+                self.callbacks.pop(service_name, None)
     
     def _on_config_change(self, file_path: str):
         """Handle configuration file changes."""
+        # Cached compatible configs and env files may be stale now
+        invalidate_config_cache()
+        clear_env_file_cache()
+        
         try:
             # Determine which services might be affected
             affected_services = self._get_affected_services(file_path)
+            mtimes = self._env_file_mtimes()
             
-            with self.lock:
-                for service_name in affected_services:
-                    if service_name in self.callbacks:
+            for service_name in affected_services:
+                # Snapshot callbacks so user code runs without holding the lock
+                callbacks = self.callbacks.get(service_name)
+                if not callbacks:
+                    continue
+                
+                try:
+                    # Reload configuration unless its env files are unchanged.
+                    # This runs on the debounce timer thread, so _load_cache is
+                    # only touched under the lock; the load itself runs outside it.
+                    with self.lock:
+                        cached = self._load_cache.get(service_name)
+                    if cached is not None and cached[0] == mtimes:
+                        new_config = cached[1]
+                    else:
+                        new_config = self.config_loader.create_service_config(service_name)
+                        with self.lock:
+                            self._load_cache[service_name] = (mtimes, new_config)
+                    
+                    # Check if configuration actually changed
+                    with self.lock:
+                        old_config = self.current_configs.get(service_name)
+                        if old_config is not None and not self._config_changed(old_config, new_config):
+                            continue
+                        self.current_configs[service_name] = new_config
+                    
+                    # Notify all callbacks
+                    for callback in callbacks:
                         try:
-                            # Reload configuration
-                            new_config = self.config_loader.create_service_config(service_name)
-                            old_config = self.current_configs.get(service_name)
-                            
-                            # Check if configuration actually changed
-                            if old_config is None or self._config_changed(old_config, new_config):
-                                self.current_configs[service_name] = new_config
-                                
-                                # Notify all callbacks
-                                for callback in self.callbacks[service_name]:
-                                    try:
-                                        callback(new_config)
-                                    except Exception as e:
-                                        logger.error(f"Error in config reload callback for {service_name}: {e}")
-                                
-                                logger.info(f"Configuration reloaded for service: {service_name}")
-                        
+                            callback(new_config)
                         except Exception as e:
-                            logger.error(f"Failed to reload configuration for {service_name}: {e}")
+                            logger.error(f"Error in config reload callback for {service_name}: {e}")
+                    
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("Configuration reloaded for service: %s", service_name)
+                
+                except Exception as e:
+                    logger.error(f"Failed to reload configuration for {service_name}: {e}")
         
         except Exception as e:
             logger.error(f"Error handling configuration change: {e}")
     
-    def _get_affected_services(self, file_path: str) -> Set[str]:
+    def _env_file_mtimes(self) -> Tuple[Optional[int], ...]:
+        """Modification times of the loaded env files (None if missing)."""
+        mtimes = []
+        for path in self._env_files:
+            try:
+                mtimes.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+    
+    def _get_affected_services(self, file_path: str) -> FrozenSet[str]:
         """Determine which services might be affected by a file change."""
-        file_name = Path(file_path).name
+        file_name = os.path.basename(file_path)
         
         # Service-specific files
-        if 'stream' in file_name or 'ib-stream' in file_name:
-            return {'ib-stream'}
-        elif 'contract' in file_name or 'ib-contract' in file_name:
-            return {'ib-contract'}
-        elif 'studies' in file_name or 'ib-studies' in file_name:
-            return {'ib-studies'}
+        for token, services in _SERVICES_BY_TOKEN.items():
+            if token in file_name:
+                return services
         
-        # Instance and global files affect all services
-        if file_name in ['instance.env', 'production.env', 'development.env', '.env']:
-            return {'ib-stream', 'ib-contract', 'ib-studies'}
-        
-        # Default: might affect all services
-        return {'ib-stream', 'ib-contract', 'ib-studies'}
+        # Instance, global and any other files might affect all services
+        return _ALL_SERVICES
     
     def _config_changed(self, old_config: IBBaseConfig, new_config: IBBaseConfig) -> bool:
         """Check if configuration has meaningfully changed."""
         try:
-            # Compare serialized configurations
-            old_dict = old_config.dict()
-            new_dict = new_config.dict()
-            return old_dict != new_dict
+            # Configs are frozen models; equality compares fields directly
+            # and stops at the first difference
+            return old_config != new_config
         except Exception:
             # If comparison fails, assume it changed
             return True
@@ -156,22 +240,24 @@ class ConfigHotReloader:
         
         # Filter to existing paths
         existing_paths = []
-        for path in watch_paths:
-            path = Path(path)
-            if path.exists():
-                existing_paths.append(str(path))
+        for path in map(str, watch_paths):
+            if os.path.isdir(path):
+                existing_paths.append(path)
             else:
-                logger.debug(f"Watch path does not exist: {path}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Watch path does not exist: %s", path)
         
         if not existing_paths:
             logger.warning("No configuration directories found to watch")
             return
         
+        from watchdog.observers import Observer
+        
         self.observer = Observer()
-        handler = ConfigFileHandler(self._on_config_change)
+        self.handler = _config_file_handler_class()(self._on_config_change)
         
         for path in existing_paths:
-            self.observer.schedule(handler, path, recursive=True)
+            self.observer.schedule(self.handler, path, recursive=True)
             logger.info(f"Watching configuration directory: {path}")
         
         self.observer.start()
@@ -183,6 +269,8 @@ class ConfigHotReloader:
             self.observer.stop()
             self.observer.join()
             self.observer = None
+            self.handler.cancel()
+            self.handler = None
             logger.info("Configuration hot-reload stopped")
     
     def get_current_config(self, service_name: str) -> Optional[IBBaseConfig]:
@@ -7,15 +7,75 @@ dangerous shell-based approach with Python dotenv parsing.
 
 import os
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set, Tuple
 
-from dotenv import load_dotenv, find_dotenv
-from .base import IBBaseConfig, IBEnvironment
+from .base import IBBaseConfig, IBEnvironment, shared_env_snapshot
 from .orchestration import IBOrchestrationConfig, load_orchestration_config
 
 logger = logging.getLogger(__name__)
 
+# Existing dotenv files per (project_root, environment)
+_RESOLVED_FILES_CACHE: Dict[Tuple[Path, str], List[Path]] = {}
+
+# Parsed dotenv files: path -> (st_mtime_ns, values, needs_interpolation)
+_ENV_FILE_CACHE: Dict[Path, Tuple[int, Dict[str, Optional[str]], bool]] = {}
+
+
+def clear_env_file_cache() -> None:
+    """Forget resolved and parsed dotenv files, e.g. after files are added or removed."""
+    _RESOLVED_FILES_CACHE.clear()
+    _ENV_FILE_CACHE.clear()
+
+
+def _file_names(directory: Path) -> Set[str]:
+    """Names of the regular files in a directory (empty if it is missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+
+def _apply_dotenv_file(env_file: Path) -> None:
+    """
+    Load a dotenv file into os.environ without overriding existing variables.
+    
+    The parsed file is reused until its mtime changes. Files that use
+    ``${VAR}`` interpolation depend on the current environment, so those
+    are handed to load_dotenv each time.
+    """
+    try:
+        mtime = env_file.stat().st_mtime_ns
+    except OSError:
+        return
+    
+    # Imported here so services that never find a dotenv file skip loading it
+    from dotenv import dotenv_values, load_dotenv
+    
+    cached = _ENV_FILE_CACHE.get(env_file)
+    if cached is None or cached[0] != mtime:
+        values = dotenv_values(env_file, interpolate=False)
+        needs_interpolation = any(value and '${' in value for value in values.values())
+        cached = (mtime, values, needs_interpolation)
+        _ENV_FILE_CACHE[env_file] = cached
+    
+    _, values, needs_interpolation = cached
+    
+    # With override=False a file whose keys are all set already is a no-op;
+    # checking is cheaper than re-parsing it with load_dotenv
+    if all(key in os.environ for key, value in values.items() if value is not None):
+        return
+    
+    if needs_interpolation:
+        load_dotenv(dotenv_path=env_file, override=False)
+        return
+    
+    for key, value in values.items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+
 
 class ConfigLoader:
     """
@@ -48,6 +108,19 @@ class ConfigLoader:
         Args:
             environment: Target environment
         """
+        loaded_files = []
+        for env_file in self._existing_dotenv_files(environment):
+            logger.debug(f"Loading environment file: {env_file}")
+            _apply_dotenv_file(env_file)
+            loaded_files.append(str(env_file))
+        
+        if loaded_files:
+            logger.info(f"Loaded environment files: {loaded_files}")
+        else:
+            logger.warning("No environment files found")
+    
+    def _dotenv_file_paths(self, environment: IBEnvironment) -> List[Path]:
+        """Candidate dotenv files for an environment, highest priority first."""
         env_files = [
             self.config_dir / f".env.{environment.value}.local",
             self.config_dir / f".env.{environment.value}",
@@ -63,19 +136,43 @@ class ConfigLoader:
             self.project_root / ".env",
         ]
         
-        all_files = env_files + legacy_files
-        
-        loaded_files = []
-        for env_file in all_files:
-            if env_file.exists():
-                logger.debug(f"Loading environment file: {env_file}")
-                load_dotenv(dotenv_path=env_file, override=False)
-                loaded_files.append(str(env_file))
+        return env_files + legacy_files
+    
+    def _existing_dotenv_files(self, environment: IBEnvironment) -> List[Path]:
+        """Dotenv files present for an environment, resolved once per process."""
+        key = (self.project_root, environment.value)
+        files = _RESOLVED_FILES_CACHE.get(key)
+        if files is None:
+            # One directory listing per directory instead of a stat per candidate
+            present = {
+                directory: _file_names(directory)
+                for directory in (self.config_dir, self.project_root)
+            }
+            files = [
+                path for path in self._dotenv_file_paths(environment)
+                if path.name in present[path.parent]
+            ]
+            _RESOLVED_FILES_CACHE[key] = files
+        return files
+    
+    def _legacy_file_paths(self, environment: IBEnvironment) -> List[Path]:
+        """Legacy ib-stream env files loaded by create_service_config."""
+        return [
+            self.project_root / "ib-stream" / "config" / f"{environment.value}.env",
+            self.project_root / "ib-stream" / "config" / "instance.env",
+        ]
+    
+    def env_file_paths(self, environment: IBEnvironment = IBEnvironment.DEVELOPMENT) -> List[Path]:
+        """
+        Every file create_service_config may read for an environment.
         
-        if loaded_files:
-            logger.info(f"Loaded environment files: {loaded_files}")
-        else:
-            logger.warning("No environment files found")
+        Args:
+            environment: Target environment
+            
+        Returns:
+            Candidate paths, whether or not they currently exist
+        """
+        return self._dotenv_file_paths(environment) + self._legacy_file_paths(environment)
     
     def load_legacy_env_file(self, env_file_path: str) -> None:
         """
@@ -87,44 +184,85 @@ class ConfigLoader:
         Args:
             env_file_path: Path to legacy .env file
         """
-        env_path = Path(env_file_path)
-        if not env_path.exists():
-            logger.warning(f"Legacy env file not found: {env_path}")
-            return
+        self.load_legacy_env_files([env_file_path])
+    
+    def load_legacy_env_files(self, env_file_paths: List[str], missing_ok: bool = False) -> None:
+        """
+        Load several legacy .env files in a single pass.
         
-        logger.info(f"Loading legacy env file: {env_path}")
+        All files are parsed into one mapping (earlier files win, as with
+        sequential loading) which is then applied to ``os.environ`` once.
+        Existing environment variables are never overridden.
         
-        try:
-            with open(env_path, 'r') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    
-                    # Skip comments and empty lines
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    # Parse key=value pairs
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip()
-                        
-                        # Remove quotes if present
-                        if value.startswith('"') and value.endswith('"'):
-                            value = value[1:-1]
-                        elif value.startswith("'") and value.endswith("'"):
-                            value = value[1:-1]
-                        
-                        # Only set if not already set (don't override)
-                        if key not in os.environ:
-                            os.environ[key] = value
-                            logger.debug(f"Set {key}={value}")
-                    else:
-                        logger.warning(f"Invalid line {line_num} in {env_path}: {line}")
-                        
-        except Exception as e:
-            logger.error(f"Error loading legacy env file {env_path}: {e}")
-            raise
+        Args:
+            env_file_paths: Paths to legacy .env files, in priority order
+            missing_ok: Skip missing files silently instead of warning
+        """
+        merged: Dict[str, str] = {}
+        for env_file_path in env_file_paths:
+            env_path = Path(env_file_path)
+            
+            # Open directly rather than stat first; absence is the common case
+            try:
+                values = self._parse_legacy_env_file(env_path)
+            except FileNotFoundError:
+                if not missing_ok:
+                    logger.warning(f"Legacy env file not found: {env_path}")
+                continue
+            except Exception as e:
+                logger.error(f"Error loading legacy env file {env_path}: {e}")
+                raise
+            
+            logger.info(f"Loaded legacy env file: {env_path}")
+            
+            for key, value in values.items():
+                merged.setdefault(key, value)
+        
+        # Only set variables that are not already set (don't override)
+        missing = {key: value for key, value in merged.items() if key not in os.environ}
+        os.environ.update(missing)
+        if missing and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Set %s", ", ".join(f"{key}={value}" for key, value in missing.items()))
+    
+    def apply_env_files(self, environment: IBEnvironment = IBEnvironment.DEVELOPMENT) -> None:
+        """
+        Apply the env files create_service_config reads, without logging.
+        
+        Existing variables are never overridden, so applying the files ahead
+        of create_service_config does not change the resulting config. Files
+        that fail to parse are skipped; the config load itself reports them.
+        
+        Args:
+            environment: Target environment
+        """
+        for env_file in self._existing_dotenv_files(environment):
+            _apply_dotenv_file(env_file)
+        
+        merged: Dict[str, str] = {}
+        for env_path in self._legacy_file_paths(environment):
+            try:
+                values = self._parse_legacy_env_file(env_path)
+            except Exception:
+                continue
+            for key, value in values.items():
+                merged.setdefault(key, value)
+        
+        for key, value in merged.items():
+            os.environ.setdefault(key, value)
+    
+    def _parse_legacy_env_file(self, env_path: Path) -> Dict[str, str]:
+        """
+        Parse a legacy .env file into a dictionary.
+        
+        Uses python-dotenv's parser without interpolation, so shell-style
+        ``${VAR:-default}`` references are kept as literal text. Keys without
+        a value are skipped. Raises FileNotFoundError if the file is missing.
+        """
+        from dotenv import dotenv_values
+        
+        with open(env_path, 'r') as f:
+            values = dotenv_values(stream=f, interpolate=False)
+        return {key: value for key, value in values.items() if value is not None}
     
     def create_service_config(
         self,
@@ -147,14 +285,7 @@ class ConfigLoader:
         self.load_environment_files(environment)
         
         # Load legacy files if they exist
-        legacy_files = [
-            self.project_root / "ib-stream" / "config" / f"{environment.value}.env",
-            self.project_root / "ib-stream" / "config" / "instance.env",
-        ]
-        
-        for legacy_file in legacy_files:
-            if legacy_file.exists():
-                self.load_legacy_env_file(str(legacy_file))
+        self.load_legacy_env_files(self._legacy_file_paths(environment), missing_ok=True)
         
         # Create base configuration with proper service name
         config_data = {
@@ -165,7 +296,8 @@ class ConfigLoader:
         }
         
         try:
-            return IBBaseConfig(**config_data)
+            with shared_env_snapshot():
+                return IBBaseConfig(**config_data)
         except Exception as e:
             logger.error(f"Failed to create configuration for {service_name}: {e}")
             raise
@@ -189,6 +321,22 @@ class ConfigLoader:
         return load_orchestration_config(str(self.project_root), environment)
 
 
+@lru_cache(maxsize=4)
+def _detect_project_root(start: str) -> str:
+    """Find the nearest directory at or above start with pyproject.toml or setup.py."""
+    current = Path(start)
+    for parent in [current] + list(current.parents):
+        if (parent / "pyproject.toml").exists() or (parent / "setup.py").exists():
+            return str(parent)
+    return start
+
+
+@lru_cache(maxsize=4)
+def _get_loader(project_root: str) -> ConfigLoader:
+    """Shared ConfigLoader per project root."""
+    return ConfigLoader(project_root)
+
+
 def load_config(
     service_name: str,
     project_root: Optional[str] = None,
@@ -209,13 +357,7 @@ def load_config(
     """
     # Auto-detect project root if not provided
     if project_root is None:
-        project_root = os.getcwd()
-        # Try to find project root by looking for specific files
-        current = Path(project_root)
-        for parent in [current] + list(current.parents):
-            if (parent / "pyproject.toml").exists() or (parent / "setup.py").exists():
-                project_root = str(parent)
-                break
+        project_root = _detect_project_root(os.getcwd())
     
     # Get environment from env var if not provided
     if environment is None:
@@ -226,7 +368,7 @@ def load_config(
             logger.warning(f"Invalid environment '{env_str}', using development")
             environment = IBEnvironment.DEVELOPMENT
     
-    loader = ConfigLoader(project_root)
+    loader = _get_loader(project_root)
     return loader.create_service_config(service_name, environment, **overrides)
 
 
@@ -297,13 +439,16 @@ def validate_configuration() -> Dict[str, Any]:
     
     # Check for legacy files that should be migrated
     project_root = Path(os.getcwd())
-    legacy_files = [
-        project_root / "ib-stream" / "config" / "remote-gateway.env",
-        project_root / "ib-stream" / "config" / "production-server.env",
-        project_root / "start-production.sh",
-    ]
+    legacy_files = {
+        project_root / "ib-stream" / "config": ("remote-gateway.env", "production-server.env"),
+        project_root: ("start-production.sh",),
+    }
     
-    found_legacy = [f for f in legacy_files if f.exists()]
+    # One directory listing per directory instead of a stat per file
+    found_legacy = []
+    for directory, names in legacy_files.items():
+        present = _file_names(directory)
+        found_legacy.extend(directory / name for name in names if name in present)
     if found_legacy:
         results['warnings'].append(f"Found legacy configuration files: {[str(f) for f in found_legacy]}")
         results['recommendations'].append("Consider migrating to new configuration format")
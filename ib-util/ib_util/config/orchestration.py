@@ -6,14 +6,37 @@ with shared resources, port allocation, and environment management.
 """
 
 import hashlib
+import io
+import os
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Any, TextIO, Tuple
 from pathlib import Path
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+from . import _validators
 from .base import IBEnvironment, IBBaseConfig, IBConnectionConfig, IBServerConfig, IBStorageConfig
 
 
+# Supervisor [program] section, rendered once per service
+_SUPERVISOR_PROGRAM_TEMPLATE = """\
+[program:{program_name}]
+command={command}
+directory={directory}
+environment={env_string}
+autostart=true
+autorestart=true
+startretries=3
+user={user}
+stdout_logfile={project_root}/logs/{program_name}-stdout.log
+stderr_logfile={project_root}/logs/{program_name}-stderr.log
+stdout_logfile_maxbytes=10MB
+stderr_logfile_maxbytes=10MB
+stdout_logfile_backups=5
+stderr_logfile_backups=5
+"""
+
+
 class ServiceType(str, Enum):
     """Supported service types."""
     STREAM = "ib-stream"
@@ -69,6 +92,11 @@ class IBOrchestrationConfig(BaseModel):
     health_check_interval: int = Field(default=30, description="Health check interval in seconds")
     startup_delay: int = Field(default=5, description="Delay between service startups")
     
+    # Per-service (base_config, service snapshot, result) for get_service_config
+    _service_configs: Dict[str, Tuple[IBBaseConfig, Optional[ServiceConfig], Optional[IBBaseConfig]]] = PrivateAttr(
+        default_factory=dict
+    )
+    
     class Config:
         arbitrary_types_allowed = True
     
@@ -123,34 +151,62 @@ class IBOrchestrationConfig(BaseModel):
         )
     
     @staticmethod
+    @lru_cache(maxsize=32)
     def _generate_instance_hash(project_root: str) -> int:
-        """Generate a hash from the project root path for instance isolation."""
+        """
+        Generate a hash from the project root path for instance isolation.
+        
+        MD5 is kept (not for security) so the derived ports and client IDs
+        match generate_instance_config.py and existing deployments.
+        """
         normalized_path = str(Path(project_root).absolute())
-        hash_object = hashlib.md5(normalized_path.encode())
-        return int(hash_object.hexdigest()[:8], 16)
+        # First 4 digest bytes, i.e. the same value as int(hexdigest()[:8], 16)
+        return int.from_bytes(hashlib.md5(normalized_path.encode()).digest()[:4], 'big')
     
     def get_service_config(self, service_name: str) -> Optional[IBBaseConfig]:
-        """Get complete configuration for a specific service."""
-        if service_name not in self.services:
-            return None
-            
-        service = self.services[service_name]
-        if not service.enabled:
-            return None
+        """
+        Get complete configuration for a specific service.
         
-        # Create a copy of base config
-        config_dict = self.base_config.dict()
+        Results are cached per service and rebuilt when the base config is
+        replaced or the service definition changes.
+        """
+        service = self.services.get(service_name)
+        cached = self._service_configs.get(service_name)
+        if cached is not None and cached[0] is self.base_config and cached[1] == service:
+            return cached[2]
         
-        # Apply service-specific modifications
-        config_dict['service_name'] = service_name
-        config_dict['connection']['client_id'] += service.client_id_offset
-        config_dict['server']['port'] += service.port_offset
+        config = self._build_service_config(service_name, service)
+        snapshot = service.model_copy(deep=True) if service is not None else None
+        self._service_configs[service_name] = (self.base_config, snapshot, config)
+        return config
+    
+    def _build_service_config(self, service_name: str, service: Optional[ServiceConfig]) -> Optional[IBBaseConfig]:
+        """Build the configuration for a service from the base config."""
+        if service is None or not service.enabled:
+            return None
         
-        # Apply any service overrides
-        for key, value in service.config_overrides.items():
-            self._set_nested_value(config_dict, key, value)
+        base = self.base_config
+        if service.config_overrides:
+            # Overrides are arbitrary user values, so validate a full rebuild
+            config_dict = base.model_dump()
+            config_dict['service_name'] = service_name
+            config_dict['connection']['client_id'] += service.client_id_offset
+            config_dict['server']['port'] += service.port_offset
+            
+            for key, value in service.config_overrides.items():
+                self._set_nested_value(config_dict, key, value)
+            
+            return IBBaseConfig(**config_dict)
         
-        return IBBaseConfig(**config_dict)
+        # Offsets only: copy the already-validated base config. model_copy
+        # skips validation, so range-check the two shifted values here.
+        client_id = _validators.check_client_id(base.connection.client_id + service.client_id_offset)
+        port = _validators.check_port(base.server.port + service.port_offset)
+        return base.model_copy(update={
+            'service_name': service_name,
+            'connection': base.connection.model_copy(update={'client_id': client_id}),
+            'server': base.server.model_copy(update={'port': port}),
+        })
     
     def _set_nested_value(self, config_dict: dict, key: str, value: Any):
         """Set a nested value in the config dictionary using dot notation."""
@@ -173,46 +229,70 @@ class IBOrchestrationConfig(BaseModel):
                 configs[service_name] = config
         return configs
     
+    def _enabled_service_bases(self) -> Iterator[Tuple[ServiceConfig, int, int]]:
+        """Yield (service, port, client_id) for each enabled service's first replica."""
+        base = self.base_config
+        for service_name, service in self.services.items():
+            if not service.enabled:
+                continue
+            if service.config_overrides:
+                # Overrides may replace the port or client ID outright
+                config = self.get_service_config(service_name)
+                yield service, config.server.port, config.connection.client_id
+            else:
+                yield (
+                    service,
+                    base.server.port + service.port_offset,
+                    base.connection.client_id + service.client_id_offset,
+                )
+    
     def get_ports_in_use(self) -> List[int]:
         """Get all ports that will be used by services."""
-        ports = []
-        for service_name in self.services:
-            config = self.get_service_config(service_name)
-            if config:
-                service = self.services[service_name]
-                for replica in range(service.replicas):
-                    ports.append(config.server.port + replica)
-        return sorted(ports)
+        return sorted(
+            port + replica
+            for service, port, _ in self._enabled_service_bases()
+            for replica in range(service.replicas)
+        )
     
     def get_client_ids_in_use(self) -> List[int]:
         """Get all client IDs that will be used by services."""
-        client_ids = []
-        for service_name in self.services:
-            config = self.get_service_config(service_name)
-            if config:
-                service = self.services[service_name]
-                for replica in range(service.replicas):
-                    client_ids.append(config.connection.client_id + replica)
-        return sorted(client_ids)
+        return sorted(
+            client_id + replica
+            for service, _, client_id in self._enabled_service_bases()
+            for replica in range(service.replicas)
+        )
     
     def validate_no_conflicts(self) -> bool:
         """Validate that there are no port or client ID conflicts."""
-        ports = self.get_ports_in_use()
-        client_ids = self.get_client_ids_in_use()
+        bases = list(self._enabled_service_bases())
         
-        # Check for duplicate ports
-        if len(ports) != len(set(ports)):
-            raise ValueError(f"Port conflicts detected: {ports}")
-        
-        # Check for duplicate client IDs
-        if len(client_ids) != len(set(client_ids)):
-            raise ValueError(f"Client ID conflicts detected: {client_ids}")
+        # Check for duplicate ports, then duplicate client IDs, stopping at the first
+        _check_unique("Port", (
+            port + replica for service, port, _ in bases for replica in range(service.replicas)
+        ))
+        _check_unique("Client ID", (
+            client_id + replica for service, _, client_id in bases for replica in range(service.replicas)
+        ))
         
         return True
     
     def to_supervisor_config(self) -> str:
         """Generate supervisor configuration for all services."""
-        lines = [
+        buffer = io.StringIO()
+        self.write_supervisor_config(buffer)
+        return buffer.getvalue()
+    
+    def write_supervisor_config(self, fp: TextIO) -> None:
+        """
+        Write supervisor configuration for all services to a text stream.
+        
+        Sections are written as they are rendered, so the complete file is
+        never held in memory.
+        
+        Args:
+            fp: Writable text stream, e.g. an open file
+        """
+        header = [
             "[unix_http_server]",
             f"file={self.project_root}/supervisor.sock",
             "",
@@ -230,55 +310,59 @@ class IBOrchestrationConfig(BaseModel):
             "",
         ]
         
+        fp.write("\n".join(header))
+        user = self._get_current_user()
         for service_name, service in self.services.items():
-            if not service.enabled:
-                continue
-                
-            config = self.get_service_config(service_name)
-            if not config:
-                continue
-            
-            env_vars = config.to_env_dict()
-            env_string = ",".join([f"{k}={v}" for k, v in env_vars.items()])
-            
-            # Determine command and directory based on service type
-            if service.name == ServiceType.STREAM:
-                command = f"{self.project_root}/.venv/bin/uvicorn ib_stream.api_server:app --host {config.server.host} --port {config.server.port}"
-                directory = f"{self.project_root}/ib-stream"
-            elif service.name == ServiceType.CONTRACT:
-                command = f"{self.project_root}/.venv/bin/uvicorn api_server:app --host {config.server.host} --port {config.server.port}"
-                directory = f"{self.project_root}/ib-contract"
-            else:
-                continue  # Skip unknown service types
-            
-            program_name = f"{service_name}-{self.environment.value}"
-            
-            lines.extend([
-                f"[program:{program_name}]",
-                f"command={command}",
-                f"directory={directory}",
-                f"environment={env_string}",
-                "autostart=true",
-                "autorestart=true",
-                "startretries=3",
-                f"user={self._get_current_user()}",
-                f"stdout_logfile={self.project_root}/logs/{program_name}-stdout.log",
-                f"stderr_logfile={self.project_root}/logs/{program_name}-stderr.log",
-                "stdout_logfile_maxbytes=10MB",
-                "stderr_logfile_maxbytes=10MB",
-                "stdout_logfile_backups=5",
-                "stderr_logfile_backups=5",
-                "",
-            ])
+            section = self._render_supervisor_program(service_name, service, user)
+            if section:
+                fp.write("\n")
+                fp.write(section)
+    
+    def _render_supervisor_program(self, service_name: str, service: ServiceConfig, user: str) -> str:
+        """Supervisor [program] section for one service (empty if not deployable)."""
+        if not service.enabled:
+            return ""
         
-        return "\n".join(lines)
+        config = self.get_service_config(service_name)
+        if not config:
+            return ""
+        
+        # The cached env_dict is read-only here, so no copy is needed
+        env_string = ",".join(map("=".join, config.env_dict.items()))
+        
+        # Determine command and directory based on service type
+        if service.name == ServiceType.STREAM:
+            command = f"{self.project_root}/.venv/bin/uvicorn ib_stream.api_server:app --host {config.server.host} --port {config.server.port}"
+            directory = f"{self.project_root}/ib-stream"
+        elif service.name == ServiceType.CONTRACT:
+            command = f"{self.project_root}/.venv/bin/uvicorn api_server:app --host {config.server.host} --port {config.server.port}"
+            directory = f"{self.project_root}/ib-contract"
+        else:
+            return ""  # Skip unknown service types
+        
+        return _SUPERVISOR_PROGRAM_TEMPLATE.format_map({
+            'program_name': f"{service_name}-{self.environment.value}",
+            'command': command,
+            'directory': directory,
+            'env_string': env_string,
+            'user': user,
+            'project_root': self.project_root,
+        })
     
     def _get_current_user(self) -> str:
         """Get the current user for supervisor configuration."""
-        import os
         return os.getenv("USER", "nobody")
 
 
+def _check_unique(label: str, values: Iterator[int]) -> None:
+    """Raise ValueError on the first value that appears twice."""
+    seen = set()
+    for value in values:
+        if value in seen:
+            raise ValueError(f"{label} conflicts detected: {value} is assigned more than once")
+        seen.add(value)
+
+
 def load_orchestration_config(
     project_root: str,
     environment: IBEnvironment = IBEnvironment.DEVELOPMENT,
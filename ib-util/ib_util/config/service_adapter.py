@@ -19,6 +19,12 @@ class BaseServiceAdapter:
     eliminating duplication between ib-stream and ib-contract configurations.
     """
     
+    __slots__ = (
+        '_service_name', '_base_config',
+        'host', 'ports', 'client_id', 'server_port', 'server_host',
+        'log_level', 'connection_timeout',
+    )
+    
     def __init__(self, service_name: str, base_config: IBBaseConfig = None):
         """
         Initialize the service adapter.
@@ -29,43 +35,18 @@ class BaseServiceAdapter:
         """
         self._service_name = service_name
         self._base_config = base_config or create_compatible_config(service_name)
-    
-    # Common properties shared by all services
-    
-    @property
-    def host(self) -> str:
-        """IB Gateway/TWS host."""
-        return self._base_config.connection.host
-    
-    @property
-    def ports(self) -> List[int]:
-        """IB Gateway/TWS ports."""
-        return self._base_config.connection.ports
-    
-    @property
-    def client_id(self) -> int:
-        """IB client ID."""
-        return self._base_config.connection.client_id
-    
-    @property
-    def server_port(self) -> int:
-        """HTTP server port."""
-        return self._base_config.server.port
-    
-    @property
-    def server_host(self) -> str:
-        """HTTP server bind address."""
-        return self._base_config.server.host
-    
-    @property
-    def log_level(self) -> str:
-        """Logging level."""
-        return self._base_config.server.log_level
-    
-    @property
-    def connection_timeout(self) -> int:
-        """Connection timeout in seconds."""
-        return self._base_config.connection.connection_timeout
+        
+        # Common settings shared by all services. The base config is frozen,
+        # so these are copied once rather than looked up on every access.
+        connection = self._base_config.connection
+        server = self._base_config.server
+        self.host: str = connection.host                        # IB Gateway/TWS host
+        self.ports: List[int] = connection.ports                # IB Gateway/TWS ports
+        self.client_id: int = connection.client_id              # IB client ID
+        self.server_port: int = server.port                     # HTTP server port
+        self.server_host: str = server.host                     # HTTP server bind address
+        self.log_level: str = server.log_level                  # Logging level
+        self.connection_timeout: int = connection.connection_timeout  # In seconds
     
     # Access to underlying configuration
     
@@ -3,9 +3,11 @@ Configuration loading utilities for IB services
 """
 
 import os
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -21,6 +23,50 @@ class ConnectionConfig:
             self.ports = [7497, 7496, 4002, 4001]
 
 
+# ${VAR:-default} substitution
+_SUBST_RE = re.compile(r'\A\$\{([^}:]+):-(.*)\}\Z')
+
+# Parsed env files: resolved path -> (st_mtime_ns, [(key, value, substitution_var)])
+_ENV_FILE_CACHE: Dict[str, Tuple[int, List[Tuple[str, str, Optional[str]]]]] = {}
+
+
+def _parse_environment_file(env_path: Path) -> List[Tuple[str, str, Optional[str]]]:
+    """
+    Parse a .env file into (key, value, substitution_var) entries.
+    
+    For ``${VAR:-default}`` values the entry holds the default and VAR, since
+    the substitution depends on the environment at load time.
+    """
+    entries = []
+    # Read and decode the file once, then split each line
+    for line in env_path.read_text().split('\n'):
+        line = line.strip()
+        # Skip empty lines and comments
+        if not line or line[0] == '#':
+            continue
+        
+        # Parse KEY=VALUE format
+        key, sep, value = line.partition('=')
+        if not sep:
+            continue
+        key = key.strip()
+        value = value.strip()
+        
+        # Remove quotes if present
+        if value and value[0] == value[-1] and value[0] in '"\'':
+            value = value[1:-1]
+        
+        # Handle variable substitution ${VAR:-default}
+        substitution_var = None
+        if value.startswith('${'):
+            match = _SUBST_RE.match(value)
+            if match:
+                substitution_var, value = match.groups()
+        
+        entries.append((key, value, substitution_var))
+    return entries
+
+
 def load_environment_file(env_file_path: str, override_existing: bool = False) -> None:
     """
     Load environment variables from a .env file with enhanced parsing features
@@ -30,6 +76,8 @@ def load_environment_file(env_file_path: str, override_existing: bool = False) -
     - Quote removal for quoted values  
     - Comment and empty line handling
     
+    Parsed files are cached until their modification time changes.
+    
     Args:
         env_file_path: Path to the environment file
         override_existing: If True, override existing env vars; if False, only set unset vars
@@ -39,52 +87,66 @@ def load_environment_file(env_file_path: str, override_existing: bool = False) -
         return  # No environment file found, use existing env vars
     
     try:
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Parse KEY=VALUE format
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Remove quotes if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    
-                    # Handle variable substitution ${VAR:-default}
-                    if value.startswith('${') and ':-' in value and value.endswith('}'):
-                        var_expr = value[2:-1]  # Remove ${ and }
-                        var_name, default_value = var_expr.split(':-', 1)
-                        value = os.getenv(var_name, default_value)
-                    
-                    # Set environment variable based on override setting
-                    if override_existing or key not in os.environ:
-                        os.environ[key] = value
-    except Exception as e:
+        mtime = env_path.stat().st_mtime_ns
+        # Callers pass cwd-relative paths; key on the resolved file
+        cache_key = str(env_path.resolve())
+        cached = _ENV_FILE_CACHE.get(cache_key)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, _parse_environment_file(env_path))
+            _ENV_FILE_CACHE[cache_key] = cached
+        
+        for key, value, substitution_var in cached[1]:
+            if substitution_var is not None:
+                value = os.getenv(substitution_var, value)
+            
+            # Set environment variable based on override setting
+            if override_existing:
+                os.environ[key] = value
+            else:
+                os.environ.setdefault(key, value)
+    except (OSError, UnicodeDecodeError) as e:
         print(f"Warning: Failed to load environment file {env_path}: {e}")
 
 
+@lru_cache(maxsize=8)
+def _find_instance_env(cwd: str) -> Optional[str]:
+    """Probe the instance.env locations once per working directory"""
+    # Try multiple possible locations
+    possible_paths = [
+        "ib-stream/config/instance.env",
+        "../ib-stream/config/instance.env", 
+        "../config/instance.env"
+    ]
+    
+    for path in possible_paths:
+        if Path(path).exists():
+            return path
+    return None
+
+
+@lru_cache(maxsize=32)
+def _resolve_env_file(cwd: str, env_file_path: str) -> Optional[str]:
+    """Probe the locations of an env file once per working directory"""
+    if Path(env_file_path).exists():
+        return env_file_path
+    
+    # Try relative to current directory
+    possible_paths = [
+        f"../ib-stream/{env_file_path}",
+        f"ib-stream/{env_file_path}",
+        f"../{env_file_path}"
+    ]
+    
+    for path in possible_paths:
+        if Path(path).exists():
+            return path
+    return None
+
+
 def load_instance_env(instance_env_path: str = None) -> None:
     """Load instance-specific environment variables using enhanced parser"""
     if instance_env_path is None:
-        # Try multiple possible locations
-        possible_paths = [
-            "ib-stream/config/instance.env",
-            "../ib-stream/config/instance.env", 
-            "../config/instance.env"
-        ]
-        
-        for path in possible_paths:
-            if Path(path).exists():
-                instance_env_path = path
-                break
+        instance_env_path = _find_instance_env(os.getcwd())
     
     if not instance_env_path:
         return
@@ -97,6 +159,9 @@ def load_environment_file_with_detection(env_file_path: Optional[str] = None) ->
     """
     Load environment variables from a .env file with automatic detection
     
+    Resolved locations are cached per working directory, so files created
+    after the first lookup are not picked up until the process restarts.
+    
     Args:
         env_file_path: Optional specific path. If None, auto-detects based on IB_STREAM_ENV
     """
@@ -105,29 +170,58 @@ def load_environment_file_with_detection(env_file_path: Optional[str] = None) ->
         env_name = os.getenv("IB_STREAM_ENV", "production")
         env_file_path = f"config/{env_name}.env"
     
-    env_path = Path(env_file_path)
-    if not env_path.exists():
-        # Try relative to current directory
-        possible_paths = [
-            env_file_path,
-            f"../ib-stream/{env_file_path}",
-            f"ib-stream/{env_file_path}",
-            f"../{env_file_path}"
-        ]
-        
-        for path in possible_paths:
-            if Path(path).exists():
-                env_path = Path(path)
-                break
+    resolved_path = _resolve_env_file(os.getcwd(), str(env_file_path))
+    if resolved_path is not None:
+        load_environment_file(resolved_path, override_existing=False)
+
+
+# Environment variables that determine a ConnectionConfig
+_CONNECTION_ENV_VARS = (
+    "IB_STREAM_HOST",
+    "IB_STREAM_PORTS",
+    "IB_STREAM_CLIENT_ID",
+    "IB_CONTRACTS_CLIENT_ID",
+    "IB_STREAM_CONNECTION_TIMEOUT",
+)
+
+
+@lru_cache(maxsize=4)
+def _connection_settings(service_type: str, env_values: Tuple[Optional[str], ...]) -> Tuple[str, Tuple[int, ...], int, int]:
+    """Parse connection settings for a service from the values of _CONNECTION_ENV_VARS"""
+    host_env, ports_env, stream_client_id, contracts_client_id, timeout_env = env_values
+    
+    # Get connection settings
+    host = host_env if host_env is not None else "127.0.0.1"
+    
+    if ports_env is None:
+        ports_env = "7497,7496,4002,4001"
+    try:
+        # int() ignores surrounding whitespace, so "7497, 7496" parses as is
+        ports = [int(p) for p in ports_env.split(",")]
+    except ValueError:
+        print(f"Warning: Invalid ports in IB_STREAM_PORTS: {ports_env}, using defaults")
+        ports = [7497, 7496, 4002, 4001]
+    
+    # Determine client ID based on service type
+    if stream_client_id is None:
+        stream_client_id = "1"
+    if service_type == "contracts" and contracts_client_id is not None:
+        client_id = int(contracts_client_id)
+    else:
+        client_id = int(stream_client_id)
+    
+    connection_timeout = int(timeout_env if timeout_env is not None else "15")
     
-    if env_path.exists():
-        load_environment_file(str(env_path), override_existing=False)
+    return host, tuple(ports), client_id, connection_timeout
 
 
 def load_environment_config(service_type: str = "stream") -> ConnectionConfig:
     """
     Load connection configuration from environment variables with enhanced parsing
     
+    Parsed settings are cached per service type and environment values, so
+    repeated calls (e.g. from connection retries) skip re-parsing.
+    
     Args:
         service_type: "stream" or "contracts" to determine which client ID to use
         
@@ -140,27 +234,12 @@ def load_environment_config(service_type: str = "stream") -> ConnectionConfig:
     # Load environment-specific configuration
     load_environment_file_with_detection()
     
-    # Get connection settings
-    host = os.getenv("IB_STREAM_HOST", "127.0.0.1")
-    
-    ports_env = os.getenv("IB_STREAM_PORTS", "7497,7496,4002,4001")
-    try:
-        ports = [int(p.strip()) for p in ports_env.split(",")]
-    except ValueError:
-        print(f"Warning: Invalid ports in IB_STREAM_PORTS: {ports_env}, using defaults")
-        ports = [7497, 7496, 4002, 4001]
-    
-    # Determine client ID based on service type
-    if service_type == "contracts":
-        client_id = int(os.getenv("IB_CONTRACTS_CLIENT_ID", os.getenv("IB_STREAM_CLIENT_ID", "1")))
-    else:
-        client_id = int(os.getenv("IB_STREAM_CLIENT_ID", "1"))
-    
-    connection_timeout = int(os.getenv("IB_STREAM_CONNECTION_TIMEOUT", "15"))
+    env_values = tuple(map(os.environ.get, _CONNECTION_ENV_VARS))
+    host, ports, client_id, connection_timeout = _connection_settings(service_type, env_values)
     
     return ConnectionConfig(
         host=host,
-        ports=ports,
+        ports=list(ports),
         client_id=client_id,
         connection_timeout=connection_timeout
-    )
\ No newline at end of file
+    )
@@ -40,6 +40,16 @@ class IBConnection(EWrapper, EClient):
         self.api_thread = None
         self.connection_event = threading.Event()
         
+        # Live socket verification in is_connected() is rate limited
+        self._last_verify_ts = 0.0
+        self._verify_interval = 0.25
+        
+        # Socket and isConnected of the EClient connection object they came from;
+        # rebound whenever self.conn is replaced
+        self._bound_conn = None
+        self._conn_socket = None
+        self._conn_isconnected = None
+        
         # Optional callbacks for connection events
         self.on_connected: Optional[Callable] = None
         self.on_disconnected: Optional[Callable] = None
@@ -65,6 +75,7 @@ class IBConnection(EWrapper, EClient):
         """Called when connection is closed"""
         self.connected = False
         self.next_valid_id = None  # Clear this too to ensure is_connected() returns False
+        self._last_verify_ts = 0.0
         self.connection_event.clear()
         
         logger.warning("TWS connection closed")
@@ -81,6 +92,7 @@ class IBConnection(EWrapper, EClient):
             logger.warning("Critical connection error %d: %s", errorCode, errorString)
             self.connected = False
             self.next_valid_id = None
+            self._last_verify_ts = 0.0
             if self.on_disconnected:
                 self.on_disconnected()
         
@@ -133,17 +145,37 @@ class IBConnection(EWrapper, EClient):
         if self.api_thread and self.api_thread.is_alive():
             self.api_thread.join(timeout=2)
     
+    def _bind_connection(self, conn):
+        """Resolve a connection object's socket and isConnected once"""
+        self._bound_conn = conn
+        self._conn_socket = getattr(conn, 'socket', None)
+        self._conn_isconnected = getattr(conn, 'isConnected', None)
+    
     def is_connected(self) -> bool:
-        """Check if properly connected with live socket verification"""
+        """
+        Check if properly connected with live socket verification
+        
+        The socket is verified at most once per ``_verify_interval`` seconds;
+        connectionClosed() and connection errors invalidate the last result.
+        """
         # First check basic connection state
         if not (self.connected and self.next_valid_id is not None):
             return False
         
+        now = time.monotonic()
+        if now - self._last_verify_ts < self._verify_interval:
+            return True
+        
+        # EClient creates a new connection object on every connect()
+        conn = getattr(self, 'conn', None)
+        if conn is not self._bound_conn:
+            self._bind_connection(conn)
+        
         # Verify the underlying socket is still alive using IB API patterns
         try:
             # Check if the socket is still connected
-            if hasattr(self, 'conn') and hasattr(self.conn, 'isConnected'):
-                socket_alive = self.conn.isConnected()
+            if self._conn_isconnected is not None:
+                socket_alive = self._conn_isconnected()
                 if not socket_alive:
                     logger.warning("Socket connection lost (conn.isConnected=False)")
                     self.connected = False
@@ -151,11 +183,11 @@ class IBConnection(EWrapper, EClient):
                     return False
             
             # Additional check: try to get socket state directly
-            if hasattr(self, 'conn') and hasattr(self.conn, 'socket') and self.conn.socket:
+            if self._conn_socket:
                 try:
                     # Use socket.getpeername() to test if socket is connected
                     # This will raise an exception if socket is not connected
-                    self.conn.socket.getpeername()
+                    self._conn_socket.getpeername()
                 except (OSError, socket.error, AttributeError) as e:
                     logger.warning("Socket state check failed: %s", e)
                     self.connected = False
@@ -164,6 +196,7 @@ class IBConnection(EWrapper, EClient):
                     self.connectionClosed()
                     return False
             
+            self._last_verify_ts = now
             return True
         except Exception as e:
             logger.warning("Connection verification failed: %s", e)
@@ -5,21 +5,64 @@ Provides fast contract ID lookup and indexing for ib-contract service
 
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Optional, Set
-from datetime import datetime, timedelta
+from typing import Dict, FrozenSet, Optional, Set
+from datetime import datetime
 import threading
-from dataclasses import dataclass, field
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+
+def _read_cache_file(cache_file: Path) -> Optional[Dict]:
+    """Read and parse a JSON cache file, returning None if it is unreadable"""
+    try:
+        if orjson is not None:
+            return orjson.loads(cache_file.read_bytes())
+        with open(cache_file, 'r') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        logger.debug("Could not read cache file %s: %s", cache_file, e)
+        return None
+
+
 class ContractCacheEntry:
-    """Single contract cache entry with metadata"""
-    contract_data: Dict
-    cache_key: str
-    cached_at: datetime
-    file_path: Optional[Path] = None
+    """
+    Single contract cache entry with metadata
+    
+    Uses __slots__ since one entry is kept per indexed contract; cached_at is
+    a time.monotonic() timestamp.
+    """
+    
+    __slots__ = ('contract_data', 'cache_key', 'cached_at', 'file_path')
+    
+    def __init__(self, contract_data: Dict, cache_key: str, cached_at: float,
+                 file_path: Optional[Path] = None):
+        self.contract_data = contract_data
+        self.cache_key = cache_key
+        self.cached_at = cached_at
+        self.file_path = file_path
+    
+    def __repr__(self) -> str:
+        return (f"ContractCacheEntry(contract_data={self.contract_data!r}, cache_key={self.cache_key!r}, "
+                f"cached_at={self.cached_at!r}, file_path={self.file_path!r})")
+    
+    def __eq__(self, other):
+        # Field-wise comparison, as the dataclass this replaced generated
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.contract_data, self.cache_key, self.cached_at, self.file_path) ==
+                (other.contract_data, other.cache_key, other.cached_at, other.file_path))
+    
+    # Mutable, so unhashable like an eq-only dataclass
+    __hash__ = None
     
     @property
     def contract_id(self) -> int:
@@ -27,7 +70,7 @@ class ContractCacheEntry:
     
     def is_expired(self, ttl_hours: int = 24) -> bool:
         """Check if cache entry is expired"""
-        return datetime.now() - self.cached_at > timedelta(hours=ttl_hours)
+        return time.monotonic() - self.cached_at > ttl_hours * 3600
 
 class ContractIndex:
     """
@@ -37,29 +80,53 @@ class ContractIndex:
     
     def __init__(self):
         self._contract_to_entry: Dict[int, ContractCacheEntry] = {}
-        self._lock = threading.RLock()
+        # Reverse map for file events: cache file -> contract IDs indexed from it
+        self._file_to_ids: Dict[Path, Set[int]] = {}
+        self._lock = threading.Lock()
         self._last_rebuild = datetime.now()
+        self._observer = None
+        # Snapshot returned by get_all_contract_ids; None after the index changes
+        self._ids_snapshot: Optional[FrozenSet[int]] = None
         
     def add_contract(self, contract_data: Dict, cache_key: str, file_path: Optional[Path] = None):
         """Add or update contract in index"""
+        with self._lock:
+            self._add_contract_nolock(contract_data, cache_key, file_path)
+    
+    def _add_contract_nolock(self, contract_data: Dict, cache_key: str, file_path: Optional[Path] = None):
+        """Add or update contract in index; caller must hold self._lock"""
         contract_id = contract_data.get("con_id")
         if not contract_id:
             logger.warning("Contract data missing con_id, skipping index")
             return
         
         try:
-            with self._lock:
-                entry = ContractCacheEntry(
-                    contract_data=contract_data,
-                    cache_key=cache_key,
-                    cached_at=datetime.now(),
-                    file_path=file_path
-                )
-                self._contract_to_entry[contract_id] = entry
-                logger.debug(f"Indexed contract {contract_id} with cache key {cache_key}")
+            entry = ContractCacheEntry(
+                contract_data=contract_data,
+                cache_key=cache_key,
+                cached_at=time.monotonic(),
+                file_path=file_path
+            )
+            previous = self._contract_to_entry.get(contract_id)
+            if previous is not None:
+                self._unlink_file_nolock(previous.file_path, contract_id)
+            self._contract_to_entry[contract_id] = entry
+            if file_path is not None:
+                self._file_to_ids.setdefault(file_path, set()).add(contract_id)
+            self._ids_snapshot = None
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Indexed contract %s with cache key %s", contract_id, cache_key)
         except Exception as e:
             logger.error(f"Failed to index contract {contract_id}: {e}")
     
+    def _unlink_file_nolock(self, file_path: Optional[Path], contract_id: int):
+        """Drop a contract ID from the reverse file map; caller must hold self._lock"""
+        ids = self._file_to_ids.get(file_path)
+        if ids is not None:
+            ids.discard(contract_id)
+            if not ids:
+                del self._file_to_ids[file_path]
+    
     def find_by_contract_id(self, contract_id: int) -> Optional[ContractCacheEntry]:
         """Fast lookup of contract by ID"""
         with self._lock:
@@ -68,25 +135,36 @@ class ContractIndex:
     def remove_contract(self, contract_id: int) -> bool:
         """Remove contract from index"""
         with self._lock:
-            return self._contract_to_entry.pop(contract_id, None) is not None
+            entry = self._contract_to_entry.pop(contract_id, None)
+            if entry is None:
+                return False
+            self._unlink_file_nolock(entry.file_path, contract_id)
+            self._ids_snapshot = None
+            return True
     
-    def get_all_contract_ids(self) -> Set[int]:
-        """Get all indexed contract IDs"""
+    def get_all_contract_ids(self) -> FrozenSet[int]:
+        """Get all indexed contract IDs as an immutable snapshot, shared until the index changes"""
         with self._lock:
-            return set(self._contract_to_entry.keys())
+            if self._ids_snapshot is None:
+                self._ids_snapshot = frozenset(self._contract_to_entry)
+            return self._ids_snapshot
     
     def cleanup_expired(self, ttl_hours: int = 24) -> int:
         """Remove expired entries from index"""
-        removed = 0
+        # Entries cached before the cutoff are expired (see ContractCacheEntry.is_expired)
+        cutoff = time.monotonic() - ttl_hours * 3600
         with self._lock:
-            expired_ids = [
-                cid for cid, entry in self._contract_to_entry.items()
-                if entry.is_expired(ttl_hours)
-            ]
-            
-            for contract_id in expired_ids:
-                del self._contract_to_entry[contract_id]
-                removed += 1
+            kept = {}
+            removed = 0
+            for cid, entry in self._contract_to_entry.items():
+                if entry.cached_at >= cutoff:
+                    kept[cid] = entry
+                else:
+                    self._unlink_file_nolock(entry.file_path, cid)
+                    removed += 1
+            self._contract_to_entry = kept
+            if removed:
+                self._ids_snapshot = None
         
         if removed > 0:
             logger.info(f"Cleaned up {removed} expired contract cache entries")
@@ -97,12 +175,26 @@ class ContractIndex:
         """
         Rebuild index from existing cache manager
         Should be called when cache manager is initialized or periodically
+        
+        Cache files are read and parsed in parallel before the lock is taken;
+        only the index update itself runs under the lock.
         """
         rebuilt = 0
         try:
+            # Read file cache outside the lock
+            file_cache = []
+            cache_dir = cache_manager.cache_dir
+            if cache_dir.exists():
+                cache_files = self._get_safe_cache_files(cache_dir, cache_manager.prefix)
+                if cache_files:
+                    with ThreadPoolExecutor(max_workers=min(8, len(cache_files))) as executor:
+                        file_cache = list(zip(cache_files, executor.map(_read_cache_file, cache_files)))
+            
             with self._lock:
                 # Clear existing index
                 self._contract_to_entry.clear()
+                self._file_to_ids.clear()
+                self._ids_snapshot = None
                 
                 # Rebuild from memory cache
                 for cache_key, cached_data in cache_manager._memory_cache.items():
@@ -110,21 +202,14 @@ class ContractIndex:
                     rebuilt += contracts_found
                 
                 # Rebuild from file cache
-                cache_dir = cache_manager.cache_dir
-                if cache_dir.exists():
-                    for cache_file in self._get_safe_cache_files(cache_dir, cache_manager.prefix):
-                        try:
-                            with open(cache_file, 'r') as f:
-                                cached_data = json.load(f)
-                            
-                            cache_key = cache_file.stem
-                            contracts_found = self._extract_contracts_from_cache_data(
-                                cached_data, cache_key, cache_file
-                            )
-                            rebuilt += contracts_found
-                            
-                        except (json.JSONDecodeError, IOError) as e:
-                            logger.debug(f"Could not read cache file {cache_file}: {e}")
+                for cache_file, cached_data in file_cache:
+                    if cached_data is None:
+                        continue
+                    cache_key = cache_file.stem
+                    contracts_found = self._extract_contracts_from_cache_data(
+                        cached_data, cache_key, cache_file
+                    )
+                    rebuilt += contracts_found
                 
                 self._last_rebuild = datetime.now()
                 logger.info(f"Rebuilt contract index with {rebuilt} contracts from {len(self._contract_to_entry)} entries")
@@ -134,6 +219,85 @@ class ContractIndex:
         
         return rebuilt
     
+    def start_watching(self, cache_dir: Path, prefix: str) -> bool:
+        """
+        Keep the index up to date from cache file changes
+        
+        Changed files are re-indexed individually, so rebuild_from_cache_manager
+        is only needed for the initial build.
+        
+        Returns:
+            False if watchdog is not installed (callers keep relying on rebuilds)
+        """
+        try:
+            from watchdog.events import PatternMatchingEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            logger.info("watchdog not installed, contract index will only update on rebuild")
+            return False
+        
+        self.stop_watching()
+        cache_dir = Path(cache_dir)
+        cache_dir_prefix = os.path.join(str(cache_dir.resolve()), '')
+        index = self
+        
+        class _CacheFileHandler(PatternMatchingEventHandler):
+            def on_created(self, event):
+                index._index_file(Path(event.src_path), cache_dir_prefix)
+            
+            on_modified = on_created
+            
+            def on_deleted(self, event):
+                index._remove_file(Path(event.src_path))
+            
+            def on_moved(self, event):
+                index._remove_file(Path(event.src_path))
+                index._index_file(Path(event.dest_path), cache_dir_prefix)
+        
+        # Matches both date-prefixed (YYYYMMDD-prefix_*.json) and plain names
+        handler = _CacheFileHandler(patterns=[f"*{prefix}_*.json"], ignore_directories=True)
+        observer = Observer()
+        observer.schedule(handler, str(cache_dir), recursive=False)
+        observer.start()
+        self._observer = observer
+        logger.info("Watching %s for contract cache changes", cache_dir)
+        return True
+    
+    def stop_watching(self):
+        """Stop watching the cache directory"""
+        observer, self._observer = self._observer, None
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=2)
+    
+    def _index_file(self, cache_file: Path, cache_dir_prefix: str):
+        """Re-index the contracts of a single cache file"""
+        # Same containment check as _get_safe_cache_files
+        if not str(cache_file.resolve()).startswith(cache_dir_prefix) or not cache_file.is_file():
+            return
+        
+        # Partially written files fail to parse; the index keeps the old entries
+        cached_data = _read_cache_file(cache_file)
+        if cached_data is None:
+            return
+        
+        with self._lock:
+            self._remove_file_nolock(cache_file)
+            self._extract_contracts_from_cache_data(cached_data, cache_file.stem, cache_file)
+    
+    def _remove_file(self, cache_file: Path):
+        """Remove the contracts indexed from a cache file"""
+        with self._lock:
+            self._remove_file_nolock(cache_file)
+    
+    def _remove_file_nolock(self, cache_file: Path):
+        """Remove the contracts indexed from a cache file; caller must hold self._lock"""
+        stale_ids = self._file_to_ids.pop(cache_file, None)
+        if stale_ids:
+            for contract_id in stale_ids:
+                del self._contract_to_entry[contract_id]
+            self._ids_snapshot = None
+    
     def _get_safe_cache_files(self, cache_dir: Path, prefix: str) -> list:
         """
         Safely get cache files, preventing path traversal attacks
@@ -154,12 +318,11 @@ class ContractIndex:
             
             # Security check: ensure all files are within cache directory
             safe_files = []
+            # Resolve cache_dir once; os.path.join adds a trailing separator
+            cache_dir_prefix = os.path.join(str(cache_dir.resolve()), '')
             for file_path in pattern_files:
                 # Resolve to absolute path and check if it's within cache_dir
-                resolved_path = file_path.resolve()
-                resolved_cache_dir = cache_dir.resolve()
-                
-                if resolved_cache_dir in resolved_path.parents or resolved_path.parent == resolved_cache_dir:
+                if str(file_path.resolve()).startswith(cache_dir_prefix):
                     if file_path.is_file():  # Additional check
                         safe_files.append(file_path)
                     else:
@@ -175,7 +338,7 @@ class ContractIndex:
     
     def _extract_contracts_from_cache_data(self, cached_data: Dict, cache_key: str, 
                                          file_path: Optional[Path] = None) -> int:
-        """Extract contracts from cache data structure and add to index"""
+        """Extract contracts from cache data structure and add to index; caller must hold self._lock"""
         contracts_added = 0
         
         if not isinstance(cached_data, dict):
@@ -194,14 +357,14 @@ class ContractIndex:
                 
                 for contract in contracts_list:
                     if isinstance(contract, dict) and contract.get("con_id"):
-                        self.add_contract(contract, cache_key, file_path)
+                        self._add_contract_nolock(contract, cache_key, file_path)
                         contracts_added += 1
             
             # Handle direct contracts list if present
             contracts_list = cached_data.get("contracts", [])
             for contract in contracts_list:
                 if isinstance(contract, dict) and contract.get("con_id"):
-                    self.add_contract(contract, cache_key, file_path)
+                    self._add_contract_nolock(contract, cache_key, file_path)
                     contracts_added += 1
         
         except Exception as e:
@@ -218,12 +381,9 @@ class ContractIndex:
                 "memory_usage_contracts": len(self._contract_to_entry)
             }
 
-# Global contract index instance
-_global_contract_index = None
+# Global contract index instance, created at import so concurrent callers share one index
+_global_contract_index = ContractIndex()
 
 def get_contract_index() -> ContractIndex:
-    """Get or create global contract index instance"""
-    global _global_contract_index
-    if _global_contract_index is None:
-        _global_contract_index = ContractIndex()
+    """Get global contract index instance"""
     return _global_contract_index
\ No newline at end of file
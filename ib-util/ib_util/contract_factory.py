@@ -5,11 +5,18 @@ This module provides standardized factory functions for creating Contract object
 for common use cases across ib-stream, ib-contract, and other IB services.
 """
 
+
 try:
     from ibapi.contract import Contract
 except ImportError:
     # Fallback for when ibapi is not available (testing, etc.)
     class Contract:
+        __slots__ = (
+            'conId', 'symbol', 'secType', 'exchange', 'currency',
+            'lastTradeDateOrContractMonth', 'multiplier', 'tradingClass',
+            'localSymbol', 'strike', 'right', 'primaryExchange',
+        )
+        
         def __init__(self):
             self.conId = 0
             self.symbol = ""
@@ -42,6 +49,21 @@ def create_contract_by_id(contract_id: int) -> Contract:
     return contract
 
 
+def _upper(value: str) -> str:
+    """Upper-case a string, reusing it when it is already upper case"""
+    return value if value.isupper() else value.upper()
+
+
+def _build_contract(sec_type: str, symbol: str, exchange: str, currency: str) -> Contract:
+    """Create a contract with the fields shared by all factory functions"""
+    contract = Contract()
+    contract.symbol = _upper(symbol)
+    contract.secType = sec_type
+    contract.exchange = exchange
+    contract.currency = _upper(currency)
+    return contract
+
+
 def create_stock_contract(
     symbol: str,
     exchange: str = "SMART",
@@ -60,11 +82,7 @@ def create_stock_contract(
     Returns:
         Stock Contract object
     """
-    contract = Contract()
-    contract.symbol = symbol.upper()
-    contract.secType = "STK"
-    contract.exchange = exchange
-    contract.currency = currency.upper()
+    contract = _build_contract("STK", symbol, exchange, currency)
     if primary_exchange:
         contract.primaryExchange = primary_exchange
     return contract
@@ -88,11 +106,7 @@ def create_futures_contract(
     Returns:
         Futures Contract object
     """
-    contract = Contract()
-    contract.symbol = symbol.upper()
-    contract.secType = "FUT"
-    contract.exchange = exchange
-    contract.currency = currency.upper()
+    contract = _build_contract("FUT", symbol, exchange, currency)
     if expiry:
         contract.lastTradeDateOrContractMonth = expiry
     return contract
@@ -122,13 +136,9 @@ def create_option_contract(
     Returns:
         Option Contract object
     """
-    contract = Contract()
-    contract.symbol = symbol.upper()
-    contract.secType = "OPT"
-    contract.exchange = exchange
-    contract.currency = currency.upper()
+    contract = _build_contract("OPT", symbol, exchange, currency)
     contract.strike = float(strike)
-    contract.right = right.upper()
+    contract.right = _upper(right)
     contract.lastTradeDateOrContractMonth = expiry
     contract.multiplier = str(multiplier)
     return contract
@@ -150,12 +160,7 @@ def create_forex_contract(
     Returns:
         Forex Contract object
     """
-    contract = Contract()
-    contract.symbol = symbol.upper()
-    contract.secType = "CASH"
-    contract.exchange = exchange
-    contract.currency = currency.upper()
-    return contract
+    return _build_contract("CASH", symbol, exchange, currency)
 
 
 def create_index_contract(
@@ -174,12 +179,22 @@ def create_index_contract(
     Returns:
         Index Contract object
     """
-    contract = Contract()
-    contract.symbol = symbol.upper()
-    contract.secType = "IND"
-    contract.exchange = exchange
-    contract.currency = currency.upper()
-    return contract
+    return _build_contract("IND", symbol, exchange, currency)
+
+
+# Default (exchange, currency) for contract lookup by security type
+_LOOKUP_DEFAULTS = {
+    "STK": ("SMART", "USD"),
+    "FUT": ("CME", "USD"),
+    "OPT": ("SMART", "USD"),
+    "CASH": ("IDEALPRO", "USD"),
+    "IND": ("CME", "USD"),
+    "CFD": ("SMART", "USD"),
+    "BOND": ("SMART", "USD"),
+    "FUND": ("FUNDSERV", "USD"),
+    "CMDTY": ("NYMEX", "USD"),
+}
+_LOOKUP_FALLBACK = ("", "USD")
 
 
 def create_contract_for_lookup(
@@ -202,36 +217,15 @@ def create_contract_for_lookup(
     Returns:
         Contract object configured for lookup
     """
-    contract = Contract()
-    contract.symbol = symbol.upper()
-    contract.secType = sec_type.upper()
+    sec_type = _upper(sec_type)
     
     # Apply defaults based on security type if not specified
     if not exchange or not currency:
-        defaults = _get_lookup_defaults(sec_type)
-        contract.exchange = exchange or defaults["exchange"]
-        contract.currency = (currency or defaults["currency"]).upper()
-    else:
-        contract.exchange = exchange
-        contract.currency = currency.upper()
+        default_exchange, default_currency = _LOOKUP_DEFAULTS.get(sec_type, _LOOKUP_FALLBACK)
+        exchange = exchange or default_exchange
+        currency = currency or default_currency
     
-    return contract
-
-
-def _get_lookup_defaults(sec_type: str) -> dict:
-    """Get default exchange and currency for contract lookup by security type"""
-    defaults = {
-        "STK": {"exchange": "SMART", "currency": "USD"},
-        "FUT": {"exchange": "CME", "currency": "USD"},
-        "OPT": {"exchange": "SMART", "currency": "USD"},
-        "CASH": {"exchange": "IDEALPRO", "currency": "USD"},
-        "IND": {"exchange": "CME", "currency": "USD"},
-        "CFD": {"exchange": "SMART", "currency": "USD"},
-        "BOND": {"exchange": "SMART", "currency": "USD"},
-        "FUND": {"exchange": "FUNDSERV", "currency": "USD"},
-        "CMDTY": {"exchange": "NYMEX", "currency": "USD"},
-    }
-    return defaults.get(sec_type.upper(), {"exchange": "", "currency": "USD"})
+    return _build_contract(sec_type, symbol, exchange, currency)
 
 
 def validate_contract(contract: Contract) -> list:
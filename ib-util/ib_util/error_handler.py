@@ -5,7 +5,10 @@ This module provides common error handling patterns used across ib-stream, ib-co
 and other IB API services. It centralizes error code interpretation and logging.
 """
 
+from __future__ import annotations
+
 import logging
+from types import MappingProxyType
 from typing import Optional, Callable, Any
 
 # Global reference to background stream manager for farm status updates
@@ -22,6 +25,47 @@ def _update_farm_status(farm_name: str, is_connected: bool):
         _background_stream_manager.update_market_data_farm_status(farm_name, is_connected)
 
 
+# Error code groups
+_CRITICAL_CONNECTION_CODES = frozenset({504, 1100, 1101, 1102})
+_FARM_STATUS_CODES = frozenset({2104, 2106, 2158})
+_API_STATUS_CODES = frozenset({2100, 2101, 2102, 2103})
+_INFORMATIONAL_CODES = _FARM_STATUS_CODES | _API_STATUS_CODES
+_CONNECTION_ERROR_CODES = frozenset({502, 504, 1100})
+
+# handle_tws_error dispatch: error_code -> (log level, message template, pass to error_callback)
+_TWS_ERROR_TABLE = {
+    502: (logging.ERROR, "Couldn't connect to TWS. Make sure TWS/Gateway is running.", True),
+    200: (logging.WARNING, "No security definition found for request %(req_id)s", True),
+    504: (logging.ERROR, "Connection timeout: %(error_string)s", True),
+    # Data request errors - handle gracefully
+    **dict.fromkeys(
+        (300, 301, 302, 303),
+        (logging.WARNING, "Data request error %(error_code)s: %(error_string)s (ReqId: %(req_id)s)", True),
+    ),
+    # Market data farm connection messages - informational only
+    **dict.fromkeys(_FARM_STATUS_CODES, (logging.INFO, "Connection status: %(error_string)s", False)),
+    # API connection status messages - informational
+    **dict.fromkeys(_API_STATUS_CODES, (logging.INFO, "API status: %(error_string)s", False)),
+}
+# System errors (1000-1999) - more serious
+_SYSTEM_ERROR = (logging.ERROR, "System error %(error_code)s: %(error_string)s (ReqId: %(req_id)s)", True)
+_GENERIC_ERROR = (logging.WARNING, "TWS error %(error_code)s: %(error_string)s (ReqId: %(req_id)s)", True)
+
+# Human-readable descriptions for get_error_description (read-only)
+_ERROR_DESCRIPTIONS = MappingProxyType({
+    200: "No security definition found",
+    502: "Couldn't connect to TWS",
+    504: "Connection timeout",
+    1100: "Connectivity between IB and TWS has been lost",
+    1101: "Connectivity between IB and TWS has been restored - data lost",
+    1102: "Connectivity between IB and TWS has been restored - data maintained",
+    2104: "Market data farm connection is OK",
+    2106: "HMDS data farm connection is OK",
+    2158: "Sec-def data farm connection is OK",
+    # Add more as needed
+})
+
+
 def handle_tws_error(
     req_id: int, 
     error_code: int, 
@@ -40,54 +84,20 @@ def handle_tws_error(
         error_callback: Optional callback function for custom error handling
     """
     try:
-        # Handle specific error codes with standardized responses
-        if error_code == 502:
-            error_msg = "Couldn't connect to TWS. Make sure TWS/Gateway is running."
-            logger.error(error_msg)
-            if error_callback:
-                error_callback(req_id, error_code, error_msg)
-                
-        elif error_code == 200:
-            error_msg = f"No security definition found for request {req_id}"
-            logger.warning(error_msg)
-            if error_callback:
-                error_callback(req_id, error_code, error_msg)
-                
-        elif error_code == 504:
-            error_msg = f"Connection timeout: {error_string}"
-            logger.error(error_msg)
-            if error_callback:
-                error_callback(req_id, error_code, error_msg)
-                
-        elif error_code in [2104, 2106, 2158]:
-            # Market data farm connection messages - informational only
-            logger.info(f"Connection status: {error_string}")
-            # Don't call error_callback for informational messages
-            
-        elif error_code in [2100, 2101, 2102, 2103]:
-            # API connection status messages - informational
-            logger.info(f"API status: {error_string}")
-            
-        elif error_code in [300, 301, 302, 303]:
-            # Data request errors - handle gracefully
-            error_msg = f"Data request error {error_code}: {error_string} (ReqId: {req_id})"
-            logger.warning(error_msg)
-            if error_callback:
-                error_callback(req_id, error_code, error_msg)
-                
-        elif error_code >= 1000 and error_code < 2000:
-            # System errors - more serious
-            error_msg = f"System error {error_code}: {error_string} (ReqId: {req_id})"
-            logger.error(error_msg)
-            if error_callback:
-                error_callback(req_id, error_code, error_msg)
-                
+        entry = _TWS_ERROR_TABLE.get(error_code)
+        if entry is None:
+            entry = _SYSTEM_ERROR if 1000 <= error_code < 2000 else _GENERIC_ERROR
+        level, template, notify = entry
+        fields = {"req_id": req_id, "error_code": error_code, "error_string": error_string}
+        
+        # Informational messages don't reach error_callback
+        if notify and error_callback:
+            error_msg = template % fields
+            logger.log(level, error_msg)
+            error_callback(req_id, error_code, error_msg)
         else:
-            # Generic error handling
-            error_msg = f"TWS error {error_code}: {error_string} (ReqId: {req_id})"
-            logger.warning(error_msg)
-            if error_callback:
-                error_callback(req_id, error_code, error_msg)
+            # Let logging format the message only if the record is emitted
+            logger.log(level, template, fields)
                 
     except Exception as e:
         # Error in error handler - log but don't re-raise to avoid infinite loops
@@ -127,16 +137,16 @@ def handle_streaming_error(
             if error_callback:
                 error_callback("CONTRACT_NOT_FOUND", error_msg)
                 
-        elif error_code in [504, 1100, 1101, 1102]:
+        elif error_code in _CRITICAL_CONNECTION_CODES:
             # Critical connection errors that indicate disconnection
             error_msg = f"Critical connection error {error_code}: {error_string}"
             logger.warning(error_msg)
             if error_callback:
                 error_callback("CRITICAL_CONNECTION_ERROR", error_msg)
                 
-        elif error_code in [2104, 2106, 2158]:
+        elif error_code in _FARM_STATUS_CODES:
             # Market data farm connection messages - can ignore
-            logger.info(f"Connection status: {error_string}")
+            logger.info("Connection status: %s", error_string)
             
             # Extract farm name and status for enhanced monitoring
             try:
@@ -172,20 +182,10 @@ def get_error_description(error_code: int) -> str:
     Returns:
         Description of the error code
     """
-    error_descriptions = {
-        200: "No security definition found",
-        502: "Couldn't connect to TWS",
-        504: "Connection timeout", 
-        1100: "Connectivity between IB and TWS has been lost",
-        1101: "Connectivity between IB and TWS has been restored - data lost",
-        1102: "Connectivity between IB and TWS has been restored - data maintained",
-        2104: "Market data farm connection is OK",
-        2106: "HMDS data farm connection is OK", 
-        2158: "Sec-def data farm connection is OK",
-        # Add more as needed
-    }
-    
-    return error_descriptions.get(error_code, f"Unknown error code {error_code}")
+    description = _ERROR_DESCRIPTIONS.get(error_code)
+    if description is None:
+        return f"Unknown error code {error_code}"
+    return description
 
 
 def is_informational_error(error_code: int) -> bool:
@@ -198,8 +198,7 @@ def is_informational_error(error_code: int) -> bool:
     Returns:
         True if the error is informational only
     """
-    informational_codes = [2100, 2101, 2102, 2103, 2104, 2106, 2158]
-    return error_code in informational_codes
+    return error_code in _INFORMATIONAL_CODES
 
 
 def is_connection_error(error_code: int) -> bool:
@@ -212,5 +211,4 @@ def is_connection_error(error_code: int) -> bool:
     Returns:
         True if the error indicates connection issues
     """
-    connection_error_codes = [502, 504, 1100]
-    return error_code in connection_error_codes
\ No newline at end of file
+    return error_code in _CONNECTION_ERROR_CODES
\ No newline at end of file
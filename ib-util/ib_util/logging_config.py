@@ -5,9 +5,15 @@ This module provides consistent logging setup across ib-stream, ib-contract,
 and other IB API services with proper TWS API noise suppression.
 """
 
+from __future__ import annotations
+
 import logging
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Set, Tuple
+
+# (service_name, verbose) pairs already set up by configure_service_logging
+_configured_services: Set[Tuple[str, bool]] = set()
 
 
 def configure_logging(
@@ -73,6 +79,9 @@ def configure_service_logging(service_name: str, verbose: bool = False) -> loggi
     """
     Configure logging for a specific IB service with consistent defaults
     
+    Logging is only configured on the first call for a given service_name and
+    verbose pair; later calls return the service logger without reconfiguring.
+    
     Args:
         service_name: Name of the service (e.g., "ib-stream", "ib-contract")
         verbose: Whether to use verbose logging
@@ -80,6 +89,9 @@ def configure_service_logging(service_name: str, verbose: bool = False) -> loggi
     Returns:
         Logger instance for the service
     """
+    if (service_name, verbose) in _configured_services:
+        return get_logger(service_name)
+    
     # Load log level from environment with sensible defaults
     if service_name == "ib-stream":
         default_level = os.getenv("IB_STREAM_LOG_LEVEL", "INFO")
@@ -95,8 +107,10 @@ def configure_service_logging(service_name: str, verbose: bool = False) -> loggi
         suppress_ibapi=True
     )
     
+    _configured_services.add((service_name, verbose))
+    
     # Return service-specific logger
-    return logging.getLogger(service_name)
+    return get_logger(service_name)
 
 
 def configure_cli_logging(verbose: bool = False) -> None:
@@ -121,6 +135,7 @@ def configure_cli_logging(verbose: bool = False) -> None:
         )
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with consistent naming
@@ -134,6 +149,22 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+# Common IB environment variables reported by log_environment_info
+_LOGGED_ENV_VARS = (
+    "IB_STREAM_HOST",
+    "IB_STREAM_PORTS",
+    "IB_STREAM_CLIENT_ID",
+    "IB_CONTRACTS_CLIENT_ID",
+    "IB_STREAM_ENV",
+    "IB_STREAM_LOG_LEVEL",
+    "IB_CONTRACTS_LOG_LEVEL"
+)
+_SENSITIVE_TOKENS = ("PASSWORD", "SECRET", "KEY")
+_MASKED_ENV_VARS = frozenset(
+    var for var in _LOGGED_ENV_VARS if any(token in var for token in _SENSITIVE_TOKENS)
+)
+
+
 def log_environment_info(logger: logging.Logger, service_name: str) -> None:
     """
     Log environment configuration information for debugging
@@ -144,22 +175,12 @@ def log_environment_info(logger: logging.Logger, service_name: str) -> None:
     """
     logger.info("=== %s Environment Configuration ===", service_name)
     
-    # Common IB environment variables
-    env_vars = [
-        "IB_STREAM_HOST",
-        "IB_STREAM_PORTS", 
-        "IB_STREAM_CLIENT_ID",
-        "IB_CONTRACTS_CLIENT_ID",
-        "IB_STREAM_ENV",
-        "IB_STREAM_LOG_LEVEL",
-        "IB_CONTRACTS_LOG_LEVEL"
-    ]
-    
-    for var in env_vars:
-        value = os.environ.get(var)
+    env = os.environ
+    for var in _LOGGED_ENV_VARS:
+        value = env.get(var)
         if value:
             # Mask sensitive values
-            if "PASSWORD" in var or "SECRET" in var or "KEY" in var:
+            if var in _MASKED_ENV_VARS:
                 logger.info("  %s: ***MASKED***", var)
             else:
                 logger.info("  %s: %s", var, value)
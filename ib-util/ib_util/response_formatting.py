@@ -12,6 +12,29 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Union
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# indent -> orjson option, for the indents orjson can produce
+_ORJSON_INDENT_OPTIONS = {None: 0, 2: orjson.OPT_INDENT_2} if orjson is not None else {}
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize Decimal values as floats for orjson"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class _DecimalEncoder(json.JSONEncoder):
+    """Custom JSON encoder to handle Decimal objects"""
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            return float(obj)
+        return super().default(obj)
+
 
 def format_timestamp(unix_timestamp: int, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
     """
@@ -52,6 +75,17 @@ def format_json_response(
     """
     Format data structure as JSON string with consistent formatting
     
+    Uses orjson when installed for compact (indent=None) and indent=2 output
+    without ensure_ascii; other combinations use the stdlib encoder. The
+    orjson output differs from json.dumps in a few ways:
+    
+    - compact output has no space after ``,`` and ``:``
+    - NaN and Infinity are written as ``null`` rather than ``NaN``/``Infinity``
+    - float exponents have no sign padding (``1e16`` rather than ``1e+16``)
+    
+    Values orjson rejects, such as integers beyond 64 bits, are serialized
+    by the stdlib encoder instead.
+    
     Args:
         data: Data to serialize as JSON
         indent: JSON indentation level
@@ -61,19 +95,22 @@ def format_json_response(
     Returns:
         Formatted JSON string
     """
-    class DecimalEncoder(json.JSONEncoder):
-        """Custom JSON encoder to handle Decimal objects"""
-        def default(self, obj):
-            if isinstance(obj, Decimal):
-                return float(obj)
-            return super().default(obj)
+    if indent in _ORJSON_INDENT_OPTIONS and not ensure_ascii:
+        option = _ORJSON_INDENT_OPTIONS[indent] | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(data, default=_json_default, option=option).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles or rejects them
+            pass
     
     return json.dumps(
         data, 
         indent=indent, 
         ensure_ascii=ensure_ascii,
         sort_keys=sort_keys,
-        cls=DecimalEncoder
+        cls=_DecimalEncoder
     )
 
 
@@ -292,6 +329,66 @@ def format_sse_event(
     return "\n".join(lines)
 
 
+# SSE field prefixes for format_sse_event_bytes
+_SSE_ID = b"id: "
+_SSE_RETRY = b"retry: "
+_SSE_EVENT = b"event: "
+_SSE_DATA = b"data: "
+_SSE_NL = b"\n"
+
+
+def format_sse_event_bytes(
+    event_type: str,
+    data: Any,
+    event_id: Optional[str] = None,
+    retry: Optional[int] = None
+) -> bytes:
+    """
+    Format Server-Sent Events (SSE) response as UTF-8 bytes
+    
+    Produces the same frame as format_sse_event(...).encode(), but serializes
+    data straight to bytes with orjson (when installed) instead of decoding
+    and re-encoding the JSON.
+    
+    Args:
+        event_type: SSE event type
+        data: Event data (will be JSON serialized)
+        event_id: Optional event ID
+        retry: Optional retry interval in milliseconds
+        
+    Returns:
+        Formatted SSE event bytes
+    """
+    parts = []
+    
+    if event_id:
+        parts += (_SSE_ID, str(event_id).encode(), _SSE_NL)
+    
+    if retry:
+        parts += (_SSE_RETRY, str(retry).encode(), _SSE_NL)
+    
+    parts += (_SSE_EVENT, event_type.encode(), _SSE_NL, _SSE_DATA)
+    
+    # Serialize data as JSON
+    if isinstance(data, str):
+        data_json = data.encode()
+    else:
+        data_json = None
+        if orjson is not None:
+            try:
+                data_json = orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
+                # Let format_json_response fall back to the stdlib encoder
+                pass
+        if data_json is None:
+            data_json = format_json_response(data, indent=None).encode()
+    parts.append(data_json)
+    
+    parts.append(_SSE_NL)  # End of event, as in format_sse_event
+    
+    return b"".join(parts)
+
+
 def format_price(price: Union[float, Decimal], decimals: int = 2) -> str:
     """
     Format price with appropriate decimal places
@@ -9,12 +9,34 @@ import time
 import logging
 import hashlib
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, Union
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple, Union
 from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=2048)
+def _format_second(epoch_sec: int) -> Tuple[str, str]:
+    """
+    Format a whole UTC second as the v2 display timestamp and ISO 8601 prefix.
+    
+    Ticks arrive many per second, so the datetime construction and strftime
+    are done once per second and the microseconds are appended by the caller.
+    """
+    dt = datetime.fromtimestamp(epoch_sec, tz=timezone.utc)
+    return dt.strftime('%Y-%m-%d %H:%M:%S UTC'), dt.strftime('%Y-%m-%dT%H:%M:%S')
+
+
+def _format_iso_utc(timestamp_us: int) -> str:
+    """Format microseconds since epoch like datetime.isoformat() + 'Z' in UTC"""
+    seconds, micros = divmod(timestamp_us, 1_000_000)
+    iso_prefix = _format_second(seconds)[1]
+    if micros:
+        return f"{iso_prefix}.{micros:06d}+00:00Z"
+    return f"{iso_prefix}+00:00Z"
+
+
 @dataclass
 class TickMessage:
     """
@@ -153,7 +175,7 @@ class TickMessage:
             'tick_type': self.tt,
             'type': self.tt,
             'unix_time': self.ts,
-            'timestamp': datetime.fromtimestamp(self.ts / 1_000_000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+            'timestamp': _format_second(self.ts // 1_000_000)[0]
         }
         
         # Add tick-type specific fields
@@ -187,7 +209,7 @@ class TickMessage:
         return {
             'type': 'tick',
             'stream_id': f"{self.cid}_{self.tt}_{self.ts}_{self.rid}",
-            'timestamp': datetime.fromtimestamp(self.st / 1_000_000, tz=timezone.utc).isoformat() + 'Z',
+            'timestamp': _format_iso_utc(self.st),
             'data': data,
             'metadata': {
                 'source': 'v3_storage',
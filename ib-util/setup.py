@@ -2,13 +2,32 @@
 Setup script for ib-util shared utilities
 """
 
+import os
+
 from setuptools import setup, find_packages
 
+# Optionally compile the configuration field validators with Cython. The
+# pure-Python source remains the fallback, so behaviour is identical without
+# a compiler. Set IB_UTIL_SKIP_CYTHON=1 to force a pure-Python build.
+ext_modules = []
+if not os.environ.get("IB_UTIL_SKIP_CYTHON"):
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        cythonize = None
+
+    if cythonize is not None:
+        ext_modules = cythonize(
+            ["ib_util/config/_validators.py"],
+            language_level=3,
+        )
+
 setup(
     name="ib-util",
     version="0.1.0",
     description="Shared utilities for Interactive Brokers API services",
     packages=find_packages(),
+    ext_modules=ext_modules,
     python_requires=">=3.8",
     install_requires=[
         "ibapi>=9.81.1",
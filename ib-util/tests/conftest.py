@@ -0,0 +1,21 @@
+"""
+Pytest configuration for ib-util unit tests.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the ib_util package importable without installing it
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture
+def isolated_environ():
+    """Restore os.environ after tests whose code under test writes to it."""
+    saved = dict(os.environ)
+    yield os.environ
+    os.environ.clear()
+    os.environ.update(saved)
@@ -0,0 +1,61 @@
+"""
+Tests for create_compatible_config result caching.
+"""
+
+import os
+
+import pytest
+
+from ib_util.config import compat
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch, isolated_environ):
+    """A minimal project whose config/.env sets the server port."""
+    for key in list(os.environ):
+        if key.startswith(compat._CONFIG_ENV_PREFIXES):
+            monkeypatch.delenv(key)
+    (tmp_path / "setup.py").write_text("")
+    (tmp_path / "config").mkdir()
+    env_file = tmp_path / "config" / ".env"
+    env_file.write_text("IB_STREAM_PORT=8101\n")
+    monkeypatch.chdir(tmp_path)
+    compat.invalidate_config_cache()
+    yield env_file
+    compat.invalidate_config_cache()
+
+
+def test_second_call_reuses_config_after_env_file_load(project):
+    first = compat.create_compatible_config("ib-stream")
+    
+    # The first load copied the .env values into os.environ
+    assert os.environ["IB_STREAM_PORT"] == "8101"
+    assert compat.create_compatible_config("ib-stream") is first
+    assert len(compat._COMPATIBLE_CONFIG_CACHE) == 1
+
+
+def test_env_file_edit_triggers_reload(project):
+    first = compat.create_compatible_config("ib-stream")
+    
+    project.write_text("IB_STREAM_PORT=8101\nIB_STREAM_MAX_STREAMS=7\n")
+    stat = project.stat()
+    os.utime(project, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    second = compat.create_compatible_config("ib-stream")
+    assert second is not first
+    assert second.server.max_streams == 7
+
+
+def test_environment_change_triggers_reload(project, monkeypatch):
+    first = compat.create_compatible_config("ib-stream")
+    
+    monkeypatch.setenv("IB_STREAM_PORT", "8102")
+    second = compat.create_compatible_config("ib-stream")
+    assert second is not first
+    assert second.server.port == 8102
+
+
+def test_invalidate_config_cache_forces_reload(project):
+    first = compat.create_compatible_config("ib-stream")
+    compat.invalidate_config_cache()
+    assert compat.create_compatible_config("ib-stream") is not first
@@ -0,0 +1,27 @@
+"""
+Tests for the legacy configuration compatibility layer.
+"""
+
+from types import SimpleNamespace
+
+from ib_util.config.compat import migrate_legacy_config_object
+
+
+def test_migrate_legacy_config_object_validates_values(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    legacy = SimpleNamespace(
+        service_name='legacy-service',
+        project_root='.',
+        host='127.0.0.1',
+        ports='4001,4002',
+        client_id=7,
+        server_port=8001,
+    )
+    
+    config = migrate_legacy_config_object(legacy)
+    
+    # Port strings are parsed and relative roots absolutized by the validators
+    assert config.connection.ports == [4001, 4002]
+    assert config.project_root == str(tmp_path.resolve())
+    assert config.connection.client_id == 7
+    assert config.server.port == 8001
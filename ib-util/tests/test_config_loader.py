@@ -0,0 +1,39 @@
+"""
+Tests for the dotenv-based configuration loader.
+"""
+
+import os
+
+from ib_util.config.base import IBEnvironment
+from ib_util.config.loader import ConfigLoader
+
+
+def test_legacy_env_files_keep_references_literal(tmp_path, monkeypatch, isolated_environ):
+    monkeypatch.setenv("IB_TEST_BASE", "/opt/ib")
+    monkeypatch.delenv("IB_TEST_STORAGE", raising=False)
+    env_file = tmp_path / "legacy.env"
+    env_file.write_text('IB_TEST_STORAGE="${IB_TEST_BASE:-/srv}/storage"\n')
+    
+    ConfigLoader(str(tmp_path)).load_legacy_env_file(str(env_file))
+    
+    assert isolated_environ["IB_TEST_STORAGE"] == "${IB_TEST_BASE:-/srv}/storage"
+
+
+def test_edited_dotenv_file_is_reparsed(tmp_path, isolated_environ):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    env_file = config_dir / ".env"
+    env_file.write_text("IB_TEST_FIRST=1\n")
+    for key in ("IB_TEST_FIRST", "IB_TEST_SECOND"):
+        isolated_environ.pop(key, None)
+    loader = ConfigLoader(str(tmp_path))
+    
+    loader.load_environment_files(IBEnvironment.DEVELOPMENT)
+    assert isolated_environ["IB_TEST_FIRST"] == "1"
+    assert "IB_TEST_SECOND" not in isolated_environ
+    
+    env_file.write_text("IB_TEST_FIRST=1\nIB_TEST_SECOND=2\n")
+    stat = env_file.stat()
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    loader.load_environment_files(IBEnvironment.DEVELOPMENT)
+    assert isolated_environ["IB_TEST_SECOND"] == "2"
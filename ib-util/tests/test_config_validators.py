@@ -0,0 +1,75 @@
+"""
+Tests for the configuration field validators, pure-Python and compiled.
+"""
+
+import shutil
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from ib_util.config import _validators
+
+VALIDATORS_DIR = Path(_validators.__file__).parent
+
+
+def test_check_ports_reports_first_invalid_port():
+    assert _validators.check_ports([4001, 4002]) == [4001, 4002]
+    with pytest.raises(ValueError, match="Invalid port: 70000"):
+        _validators.check_ports([4001, 70000, 0])
+
+
+def test_range_checks_reject_out_of_range_integers():
+    with pytest.raises(ValueError):
+        _validators.check_port(2 ** 70)
+    with pytest.raises(ValueError):
+        _validators.check_client_id(0)
+
+
+def test_clear_path_cache_forgets_existing_paths(tmp_path):
+    root = tmp_path / "project"
+    root.mkdir()
+    assert _validators.check_project_root(str(root)) == str(root)
+    
+    root.rmdir()
+    # The positive result is still cached until it is cleared
+    assert _validators.check_project_root(str(root)) == str(root)
+    _validators.clear_path_cache()
+    with pytest.raises(ValueError):
+        _validators.check_project_root(str(root))
+
+
+def test_compiled_validators_build_and_import(tmp_path):
+    pytest.importorskip("Cython")
+    if shutil.which("cc") is None and shutil.which("gcc") is None:
+        pytest.skip("no C compiler available")
+    
+    for name in ("_validators.py", "_validators.pxd"):
+        shutil.copy(VALIDATORS_DIR / name, tmp_path / name)
+    script = textwrap.dedent("""
+        import sys
+        from setuptools import setup
+        from Cython.Build import cythonize
+        
+        sys.argv[1:] = ["build_ext", "--inplace", "-q"]
+        setup(ext_modules=cythonize(["_validators.py"], language_level=3, quiet=True))
+        
+        import _validators
+        assert not _validators.__file__.endswith(".py"), _validators.__file__
+        assert _validators.valid_port(4002) and not _validators.valid_port(0)
+        assert _validators.check_ports([4001, 4002]) == [4001, 4002]
+        for check, value in ((_validators.check_port, 2 ** 70), (_validators.check_client_id, 40000)):
+            try:
+                check(value)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(value)
+        _validators.clear_path_cache()
+    """)
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=tmp_path, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
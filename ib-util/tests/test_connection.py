@@ -0,0 +1,59 @@
+"""
+Tests for IBConnection socket verification.
+"""
+
+import pytest
+
+pytest.importorskip("ibapi")
+
+from ib_util.config_loader import ConnectionConfig
+from ib_util.connection import IBConnection
+
+
+class FakeSocket:
+    def getpeername(self):
+        return ("127.0.0.1", 4002)
+
+
+class FakeConn:
+    def __init__(self, alive):
+        self.alive = alive
+        self.socket = FakeSocket()
+    
+    def isConnected(self):
+        return self.alive
+
+
+@pytest.fixture
+def connection():
+    conn = IBConnection(ConnectionConfig())
+    conn.connected = True
+    conn.next_valid_id = 1
+    return conn
+
+
+def test_is_connected_checks_live_connection(connection):
+    connection.conn = FakeConn(alive=True)
+    assert connection.is_connected()
+
+
+def test_replaced_connection_is_rebound(connection):
+    connection.conn = FakeConn(alive=True)
+    assert connection.is_connected()
+    
+    # A reconnect replaces self.conn; the stale bound refs must not be used
+    connection.conn = FakeConn(alive=False)
+    connection._last_verify_ts = 0.0
+    assert not connection.is_connected()
+
+
+def test_verification_is_rate_limited(connection):
+    connection.conn = FakeConn(alive=True)
+    assert connection.is_connected()
+    
+    # Within the verify interval the last result is reused
+    connection.conn.alive = False
+    assert connection.is_connected()
+    
+    connection._last_verify_ts = 0.0
+    assert not connection.is_connected()
@@ -0,0 +1,74 @@
+"""
+Tests for the contract cache index.
+"""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from ib_util.contract_cache import ContractCacheEntry, ContractIndex
+
+
+def test_cache_entries_compare_by_value():
+    data = {"con_id": 265598, "symbol": "AAPL"}
+    entry = ContractCacheEntry(data, "contracts_AAPL", 10.0, Path("contracts_AAPL.json"))
+    
+    assert entry == ContractCacheEntry(dict(data), "contracts_AAPL", 10.0, Path("contracts_AAPL.json"))
+    assert entry != ContractCacheEntry(data, "contracts_AAPL", 11.0, Path("contracts_AAPL.json"))
+    assert entry != "contracts_AAPL"
+    assert entry.contract_id == 265598
+    assert "contracts_AAPL" in repr(entry)
+
+
+def _write_cache_file(path, *con_ids):
+    path.write_text(json.dumps({"contracts": [{"con_id": cid, "symbol": f"S{cid}"} for cid in con_ids]}))
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+def test_remove_file_drops_only_that_files_contracts(tmp_path):
+    index = ContractIndex()
+    first, second = tmp_path / "contracts_a.json", tmp_path / "contracts_b.json"
+    index.add_contract({"con_id": 1}, "contracts_a", first)
+    index.add_contract({"con_id": 2}, "contracts_a", first)
+    index.add_contract({"con_id": 3}, "contracts_b", second)
+    # Re-indexing contract 2 from another file moves it out of the first file
+    index.add_contract({"con_id": 2}, "contracts_b", second)
+    
+    index._remove_file(first)
+    assert index.get_all_contract_ids() == {2, 3}
+    
+    assert index.remove_contract(3)
+    index._remove_file(second)
+    assert index.get_all_contract_ids() == frozenset()
+
+
+def test_watching_indexes_created_modified_and_deleted_files(tmp_path):
+    pytest.importorskip("watchdog")
+    index = ContractIndex()
+    assert index.start_watching(tmp_path, "contracts")
+    try:
+        cache_file = tmp_path / "20250101-contracts_AAPL.json"
+        _write_cache_file(cache_file, 1, 2)
+        assert _wait_for(lambda: index.get_all_contract_ids() == {1, 2})
+        
+        _write_cache_file(cache_file, 2, 3)
+        assert _wait_for(lambda: index.get_all_contract_ids() == {2, 3})
+        
+        # Files not matching the cache prefix are ignored
+        _write_cache_file(tmp_path / "other_MSFT.json", 4)
+        
+        cache_file.unlink()
+        assert _wait_for(lambda: index.get_all_contract_ids() == frozenset())
+        assert index.find_by_contract_id(4) is None
+    finally:
+        index.stop_watching()
@@ -0,0 +1,14 @@
+"""
+Tests for contract creation and validation helpers.
+"""
+
+from ib_util.contract_factory import create_stock_contract, validate_contract
+
+
+def test_validate_contract_returns_a_list():
+    assert validate_contract(create_stock_contract("AAPL")) == []
+    
+    errors = validate_contract(create_stock_contract(""))
+    assert isinstance(errors, list) and errors
+    # Callers may extend the result with their own checks
+    errors.append("custom check failed")
@@ -0,0 +1,103 @@
+"""
+Tests for the legacy environment configuration loader (ib_util.config_loader).
+"""
+
+import os
+
+from ib_util import config_loader
+
+
+def _touch_later(path):
+    """Bump a file's mtime so edits within one timestamp tick are still seen."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_edited_env_file_is_reparsed(tmp_path, isolated_environ):
+    env_file = tmp_path / "test.env"
+    env_file.write_text("IB_TEST_VALUE=first\n")
+    config_loader.load_environment_file(str(env_file), override_existing=True)
+    assert isolated_environ["IB_TEST_VALUE"] == "first"
+    
+    env_file.write_text("IB_TEST_VALUE=second\n")
+    _touch_later(env_file)
+    config_loader.load_environment_file(str(env_file), override_existing=True)
+    assert isolated_environ["IB_TEST_VALUE"] == "second"
+
+
+def test_cached_substitutions_use_current_environment(tmp_path, isolated_environ):
+    env_file = tmp_path / "test.env"
+    env_file.write_text('IB_TEST_HOST="${IB_TEST_HOST_OVERRIDE:-localhost}"\n')
+    isolated_environ.pop("IB_TEST_HOST_OVERRIDE", None)
+    
+    config_loader.load_environment_file(str(env_file), override_existing=True)
+    assert isolated_environ["IB_TEST_HOST"] == "localhost"
+    
+    isolated_environ["IB_TEST_HOST_OVERRIDE"] = "gateway"
+    config_loader.load_environment_file(str(env_file), override_existing=True)
+    assert isolated_environ["IB_TEST_HOST"] == "gateway"
+
+
+def test_existing_variables_are_kept_without_override(tmp_path, isolated_environ):
+    env_file = tmp_path / "test.env"
+    env_file.write_text("IB_TEST_VALUE=from-file\n")
+    isolated_environ["IB_TEST_VALUE"] = "from-env"
+    
+    config_loader.load_environment_file(str(env_file))
+    assert isolated_environ["IB_TEST_VALUE"] == "from-env"
+
+
+def test_connection_settings_follow_environment_changes(tmp_path, monkeypatch, isolated_environ):
+    monkeypatch.chdir(tmp_path)
+    for key in config_loader._CONNECTION_ENV_VARS:
+        isolated_environ.pop(key, None)
+    isolated_environ["IB_STREAM_PORTS"] = "4001, 4002"
+    isolated_environ["IB_STREAM_CLIENT_ID"] = "5"
+    
+    first = config_loader.load_environment_config("stream")
+    assert (first.ports, first.client_id) == ([4001, 4002], 5)
+    
+    # Each config gets its own ports list, even when the settings are cached
+    first.ports.append(9999)
+    assert config_loader.load_environment_config("stream").ports == [4001, 4002]
+    
+    isolated_environ["IB_STREAM_PORTS"] = "7497"
+    isolated_environ["IB_CONTRACTS_CLIENT_ID"] = "6"
+    assert config_loader.load_environment_config("stream").ports == [7497]
+    assert config_loader.load_environment_config("contracts").client_id == 6
+
+
+def test_instance_env_lookup_is_per_working_directory(tmp_path, monkeypatch, isolated_environ):
+    for name in ("a", "b"):
+        config_dir = tmp_path / name / "ib-stream" / "config"
+        config_dir.mkdir(parents=True)
+        (config_dir / "instance.env").write_text(f"IB_TEST_INSTANCE={name}\n")
+        (config_dir / "staging.env").write_text(f"IB_TEST_ENV_FILE={name}\n")
+    isolated_environ["IB_STREAM_ENV"] = "staging"
+    
+    for name in ("a", "b", "a"):
+        monkeypatch.chdir(tmp_path / name)
+        isolated_environ.pop("IB_TEST_INSTANCE", None)
+        isolated_environ.pop("IB_TEST_ENV_FILE", None)
+        
+        config_loader.load_instance_env()
+        config_loader.load_environment_file_with_detection()
+        assert isolated_environ["IB_TEST_INSTANCE"] == name
+        assert isolated_environ["IB_TEST_ENV_FILE"] == name
+
+
+def test_same_relative_path_in_different_directories(tmp_path, monkeypatch, isolated_environ):
+    mtime_ns = None
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        env_file = tmp_path / name / "test.env"
+        env_file.write_text(f"IB_TEST_DIR={name}\n")
+        # Same size and mtime, so only the resolved path tells them apart
+        if mtime_ns is None:
+            mtime_ns = env_file.stat().st_mtime_ns
+        os.utime(env_file, ns=(mtime_ns, mtime_ns))
+    
+    for name in ("a", "b"):
+        monkeypatch.chdir(tmp_path / name)
+        config_loader.load_environment_file("test.env", override_existing=True)
+        assert isolated_environ["IB_TEST_DIR"] == name
@@ -0,0 +1,100 @@
+"""
+Tests for configuration hot-reload.
+"""
+
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ib_util.config import hot_reload
+from ib_util.config.hot_reload import ConfigHotReloader
+from ib_util.config.loader import ConfigLoader
+
+
+@pytest.fixture
+def reloader(tmp_path):
+    return ConfigHotReloader(str(tmp_path))
+
+
+@pytest.mark.parametrize("file_name, services", [
+    ("ib-stream.env", {"ib-stream"}),
+    ("contract-dev.env", {"ib-contract"}),
+    ("studies.env", {"ib-studies"}),
+    # Several tokens: stream wins over contract, contract over studies
+    ("contract-stream.env", {"ib-stream"}),
+    ("studies-contract.env", {"ib-contract"}),
+    ("instance.env", {"ib-stream", "ib-contract", "ib-studies"}),
+    (".env", {"ib-stream", "ib-contract", "ib-studies"}),
+])
+def test_affected_services_follow_token_priority(reloader, file_name, services):
+    assert reloader._get_affected_services(f"/config/{file_name}") == services
+
+
+def test_event_bursts_coalesce_into_one_reload_per_file():
+    pytest.importorskip("watchdog")
+    reloaded = []
+    done = threading.Event()
+    
+    def reload_callback(path):
+        reloaded.append(path)
+        if len(reloaded) == 2:
+            done.set()
+    
+    handler = hot_reload.ConfigFileHandler(reload_callback)
+    handler.debounce_seconds = 0.05
+    for path in ("/config/.env", "/config/ib-stream.env", "/config/.env", "/config/.env"):
+        handler.on_modified(SimpleNamespace(src_path=path))
+    
+    assert done.wait(timeout=2)
+    time.sleep(0.1)
+    assert sorted(reloaded) == ["/config/.env", "/config/ib-stream.env"]
+
+
+def test_cancel_drops_pending_reload():
+    pytest.importorskip("watchdog")
+    reloaded = []
+    handler = hot_reload.ConfigFileHandler(reloaded.append)
+    handler.debounce_seconds = 0.05
+    handler.on_modified(SimpleNamespace(src_path="/config/.env"))
+    handler.cancel()
+    
+    time.sleep(0.15)
+    assert reloaded == []
+
+
+def test_reload_reuses_config_until_env_files_change(tmp_path, monkeypatch, isolated_environ):
+    for key in list(isolated_environ):
+        if key.startswith("IB_"):
+            del isolated_environ[key]
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    env_file = config_dir / ".env"
+    env_file.write_text("IB_CLIENT_ID=1\nIB_STREAM_PORT=8101\n")
+    
+    loads = []
+    original = ConfigLoader.create_service_config
+    
+    def counting_create_service_config(self, *args, **kwargs):
+        loads.append(args)
+        return original(self, *args, **kwargs)
+    
+    monkeypatch.setattr(ConfigLoader, "create_service_config", counting_create_service_config)
+    
+    reloader = ConfigHotReloader(str(tmp_path))
+    configs = []
+    reloader.register_callback("ib-stream", configs.append)
+    
+    reloader._on_config_change(str(env_file))
+    reloader._on_config_change(str(env_file))
+    assert len(loads) == 1
+    assert [config.server.port for config in configs] == [8101]
+    
+    env_file.write_text("IB_CLIENT_ID=1\nIB_STREAM_PORT=8101\nIB_STREAM_MAX_STREAMS=7\n")
+    stat = env_file.stat()
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reloader._on_config_change(str(env_file))
+    assert len(loads) == 2
+    assert configs[-1].server.max_streams == 7
@@ -0,0 +1,35 @@
+"""
+Tests for multi-service orchestration configuration.
+"""
+
+import pytest
+
+from ib_util.config.orchestration import IBOrchestrationConfig, ServiceConfig, ServiceType
+
+
+@pytest.fixture
+def orchestration(tmp_path, isolated_environ):
+    return IBOrchestrationConfig.create_default(str(tmp_path))
+
+
+def test_service_config_applies_offsets(orchestration):
+    base = orchestration.base_config
+    orchestration.services["ib-stream"] = ServiceConfig(
+        name=ServiceType.STREAM, port_offset=3, client_id_offset=2
+    )
+    
+    config = orchestration.get_service_config("ib-stream")
+    assert config.service_name == "ib-stream"
+    assert config.server.port == base.server.port + 3
+    assert config.connection.client_id == base.connection.client_id + 2
+
+
+@pytest.mark.parametrize("offsets", [
+    {"port_offset": 70000},
+    {"port_offset": -100000},
+    {"client_id_offset": 40000},
+])
+def test_out_of_range_offsets_are_rejected(orchestration, offsets):
+    orchestration.services["ib-stream"] = ServiceConfig(name=ServiceType.STREAM, **offsets)
+    with pytest.raises(ValueError):
+        orchestration.get_service_config("ib-stream")
@@ -0,0 +1,61 @@
+"""
+Tests for JSON and SSE response formatting.
+"""
+
+import json
+from decimal import Decimal
+
+import pytest
+
+from ib_util import response_formatting
+from ib_util.response_formatting import format_json_response
+
+requires_orjson = pytest.mark.skipif(response_formatting.orjson is None, reason="orjson not installed")
+
+
+@requires_orjson
+def test_compact_output_format():
+    data = {"b": [1, 2.5], "a": "é", "n": None}
+    assert format_json_response(data, indent=None) == '{"b":[1,2.5],"a":"é","n":null}'
+    assert format_json_response(data, indent=None, sort_keys=True) == '{"a":"é","b":[1,2.5],"n":null}'
+
+
+@requires_orjson
+def test_non_finite_floats_serialize_as_null():
+    data = [float("nan"), float("inf"), float("-inf"), 1e16]
+    assert format_json_response(data, indent=None) == "[null,null,null,1e16]"
+
+
+def test_indented_output_matches_stdlib():
+    data = {"symbol": "AAPL", "ports": [4001, 4002], "meta": {}, 3: "x"}
+    assert format_json_response(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def test_integers_beyond_64_bits_fall_back_to_stdlib():
+    data = {"value": 2 ** 64}
+    assert format_json_response(data, indent=None) == json.dumps(data)
+    assert format_json_response(data) == json.dumps(data, indent=2)
+
+
+def test_decimal_values_serialize_as_floats():
+    assert json.loads(format_json_response({"price": Decimal("1.25")}, indent=None)) == {"price": 1.25}
+
+
+def test_ensure_ascii_uses_stdlib_encoder():
+    assert format_json_response({"a": "é"}, indent=None, ensure_ascii=True) == '{"a": "\\u00e9"}'
+
+
+def test_unserializable_values_still_raise():
+    with pytest.raises(TypeError):
+        format_json_response({"value": object()}, indent=None)
+
+
+@pytest.mark.parametrize("args", [
+    ("tick", {"price": 1.5, "size": Decimal("2"), "symbol": "ÄAPL"}),
+    ("tick", {"value": 2 ** 64, 1: [None, True]}),
+    ("heartbeat", "already serialized", "42", 3000),
+    ("error", {"message": "x"}, None, None),
+    ("tick", [1, 2, 3], 7, 0),
+])
+def test_format_sse_event_bytes_matches_encoded_text(args):
+    assert response_formatting.format_sse_event_bytes(*args) == response_formatting.format_sse_event(*args).encode()
@@ -0,0 +1,41 @@
+"""
+Tests for the v3 TickMessage model.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from ib_util.storage.tick_message import TickMessage, _format_second
+
+
+def _expected_v2_timestamps(ts, st):
+    return (
+        datetime.fromtimestamp(ts / 1_000_000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'),
+        datetime.fromtimestamp(st / 1_000_000, tz=timezone.utc).isoformat() + 'Z',
+    )
+
+
+@pytest.mark.parametrize("timestamp", [
+    0,
+    1,
+    999_999,
+    1_000_000,
+    1_704_067_199_999_999,  # last microsecond of 2023
+    1_704_067_200_000_000,  # first microsecond of 2024, no fraction
+    1_704_067_200_000_001,
+    1_709_251_199_500_000,  # leap day
+    4_102_444_799_999_999,
+])
+def test_v2_timestamps_match_datetime_formatting(timestamp):
+    message = TickMessage(ts=timestamp, st=timestamp, cid=1, tt='last', rid=2, p=1.0)
+    v2 = message.to_v2_format()
+    assert (v2['data']['timestamp'], v2['timestamp']) == _expected_v2_timestamps(timestamp, timestamp)
+
+
+def test_cached_second_is_reused_across_ticks():
+    _format_second.cache_clear()
+    for micros in (0, 250_000, 999_999):
+        TickMessage(ts=1_704_067_200_000_000 + micros, st=1_704_067_200_000_000,
+                    cid=1, tt='mid_point', rid=2, mp=1.0).to_v2_format()
+    assert _format_second.cache_info().misses == 1